@@ -1,15 +1,41 @@
-import json
-import jsonschema
+import argparse
 import sys
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from os import path
 
+import numpy as np
+
 sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
 from preprocessing import create_new_instrument
+from preprocessing.artifacts import read_samples, write_samples
+from preprocessing.schema_service import schema_service
+from preprocessing.validation import BlockValidator
 
 # This script aggregates the four ADOS modules item by item into an "ADOS" instrument. I only combine items
 # if they have identical or very similar descriptions. I also retain all items, even if they don't
 # merge across modules. This means we don't lose very much information between any given module and the
 # aggregated ADOS instrument.
+#
+# The mapping of each module is compiled once into a gather over the ADOS columns: for every ADOS key, the
+# position of the module key whose value it takes (the module key mapped to it, the key of the same name if
+# nothing is mapped to it, otherwise a None). Samples are handled a block at a time, and the ADOS instruments
+# of all the samples in a block with the same module are filled in by one gather over their module values.
+# Only the new ADOS instruments are validated (the rest of the sample was validated by aggregate_phenotype.py),
+# a column at a time, so each distinct value of a column is only checked once.
+
+# By default (--policy first) the ADOS instrument is made from the first of the four ADOS modules a sample has.
+# The other policies look at every ADOS and ADOS-2 module a sample has and pick the value of each item from the
+# best ranked module that answered it, with the rest of the instrument (age, interview_date, diagnosis, scores,
+# module) taken from the best ranked module overall:
+# - latest: the latest interview_date (then the oldest age)
+# - complete: the most answered items (then the latest)
+# - age: administered at an age the module is meant for, or the closest to it (then the latest)
+# Where each item came from is recorded in ADOS_provenance, a string with a digit per ADOS item (in schema order)
+# giving the position of the module in provenance_modules, 0 where no module answered it.
+# Every sample in a block is ranked and merged at once, over a modules x samples x ADOS keys array of values.
 
 # This code requires aggregate_phenotype.py to already have been run.
 # It outputs a file called all_samples_stage2.json which contains a new ADOS instrument for all
@@ -17,13 +43,7 @@ from preprocessing import create_new_instrument
 # It is meant to be run as part of a multi-stage pipeline described in the README.
 
 # The code can be run with:
-# python3 aggregate_ados.py
-
-with open(sys.argv[1], 'r') as infile:
-	samples = json.load(infile)
-
-with open("AutismPhenotype.json") as schema_file:    
-	pheno_schema = json.load(schema_file)
+# python3 aggregate_ados.py input-file output-file [--json-array] [--policy first|latest|complete|age]
 
 feature_mapping = {
 	'ADOS_Module1': {
@@ -70,30 +90,181 @@ feature_mapping = {
 	}
 }
 
+# The ADOS-2 modules are numbered like the ADOS modules feature_mapping was written for
+for number in range(1, 5):
+	feature_mapping['ADOS2_Module%d' % number] = feature_mapping['ADOS_Module%d' % number]
+
 ados_instruments = ['ADOS_Module1', 'ADOS_Module2', 'ADOS_Module3', 'ADOS_Module4']
 
+# Modules the other policies choose from, provenance codes are 1 + position in this list
+provenance_modules = ados_instruments + ['ADOS2_Module1', 'ADOS2_Module2', 'ADOS2_Module3', 'ADOS2_Module4']
 
-if __name__ == '__main__':
-	for sample in samples:
-		ados_found = False
-		for instrument in ados_instruments:
-			if not ados_found and instrument in sample:
-				ados_found = True
+policies = ['first', 'latest', 'complete', 'age']
+
+# Ages in months each module number is meant for (None for no limit). Modules 1 and 2 are chosen by language level
+# from 31 months on, module 3 is for children and young adolescents and module 4 for older adolescents and adults.
+module_age_ranges = {1: (31, None), 2: (31, None), 3: (31, 191), 4: (192, None)}
+
+date_formats = ['%m/%d/%Y', '%Y-%m-%d', '%m/%d/%y', '%Y-%m-%d %H:%M:%S', '%Y/%m/%d']
+
+interview_days = {}
+
+# Days since 0001-01-01 of an interview_date, NaN if there isn't one or it can't be read
+def interview_day(value):
+	if value not in interview_days:
+		interview_days[value] = np.nan
+		if isinstance(value, str):
+			for date_format in date_formats:
+				try:
+					interview_days[value] = datetime.strptime(value.strip(), date_format).toordinal()
+					break
+				except ValueError:
+					pass
+	return interview_days[value]
+
+# Samples handled together
+BLOCK_SIZE = 4096
+
+# Where the value of each ADOS key comes from, for module values with the given keys (in order)
+class ModuleGather:
+	def __init__(self, module, keys, ados_keys):
+		# itemgetter only returns a tuple for two or more keys
+		self.getter = itemgetter(*keys) if len(keys) > 1 else lambda row: tuple(row[key] for key in keys)
+		self.width = len(keys)
+
+		# Two extra columns after the module values, one of Nones and one with the module name.
+		# Later keys overwrite earlier ones, as they did when the values were copied over one at a time.
+		none_column, module_column = self.width, self.width + 1
+		source = {'module': module_column}
+		for i, key in enumerate(keys):
+			if key in feature_mapping[module]:
+				source[feature_mapping[module][key]] = i
+			elif key in ados_keys:
+				source[key] = i
+		self.index = np.array([source.get(key, none_column) for key in ados_keys], dtype=np.intp)
+
+	# ADOS values for each of the module instruments in rows, one row each
+	def gather(self, module, rows):
+		values = np.empty((len(rows), self.width + 2), dtype=object)
+		values[:, :self.width] = list(map(self.getter, rows))
+		values[:, self.width] = None
+		values[:, self.width + 1] = module
+		return values[:, self.index]
 
-				# Construct an ados instrument
-				sample['ADOS'] = create_new_instrument('ADOS', pheno_schema)
-				sample['ADOS']['module'] = instrument
+class AdosAggregator:
+	def __init__(self, pheno_schema, policy='first'):
+		self.ados_keys = tuple(create_new_instrument('ADOS', pheno_schema))
+		self.column = {key: j for j, key in enumerate(self.ados_keys)}
+		self.items = np.array([key.startswith('Q') for key in self.ados_keys])
+		self.gathers = {}
+		self.policy = policy
+		self.validator = BlockValidator(pheno_schema['definitions']['ADOS'], self.ados_keys)
 
-				#Map values
-				for key, value in sample[instrument].items():
-					if key in feature_mapping[instrument]:
-						sample['ADOS'][feature_mapping[instrument][key]] = value
-					elif key in sample['ADOS']:
-						sample['ADOS'][key] = value
+	# The module aggregated into ADOS, the first of the four a sample has
+	def choose_module(self, sample):
+		return next((instrument for instrument in ados_instruments if instrument in sample), None)
 
-		jsonschema.validate(sample, pheno_schema)
+	# Gathers are compiled per module and order of keys, which is almost always the same for every sample
+	def module_gather(self, module, keys):
+		gather = self.gathers.get((module, keys))
+		if gather is None:
+			gather = self.gathers[(module, keys)] = ModuleGather(module, keys, self.ados_keys)
+		return gather
+
+	def aggregate_block(self, block):
+		if self.policy != 'first':
+			return self.merge_block(block)
+
+		groups = defaultdict(list)
+		for sample in block:
+			module = self.choose_module(sample)
+			if module is not None:
+				groups[(module, tuple(sample[module]))].append(sample)
+
+		for (module, keys), samples in groups.items():
+			values = self.module_gather(module, keys).gather(module, [sample[module] for sample in samples])
+			instruments = [dict(zip(self.ados_keys, row)) for row in values.tolist()]
+			self.validator.validate(values, instruments)
+			for sample, instrument in zip(samples, instruments):
+				sample['ADOS'] = instrument
+		return block
+
+	# A column of values as floats, NaN for None
+	def numeric(self, values, key):
+		column = values[:, :, self.column[key]]
+		return np.where(column == None, np.nan, column).astype(float)
+
+	# Sort keys for the modules of each sample under the policy, most significant first. Each is a modules x samples
+	# array and smaller is better, the remaining ties go to the module that comes first in provenance_modules.
+	def policy_keys(self, values, observed):
+		days = np.vectorize(interview_day, otypes=[float])(values[:, :, self.column['interview_date']])
+		ages = self.numeric(values, 'age')
+		latest = [np.isnan(days), -np.nan_to_num(days), np.isnan(ages), -np.nan_to_num(ages)]
+		if self.policy == 'latest':
+			return latest
+		if self.policy == 'complete':
+			return [-observed[:, :, self.items].sum(axis=2)] + latest
+		if self.policy == 'age':
+			low = np.array([[module_age_ranges[int(module[-1])][0] or 0] for module in provenance_modules], dtype=float)
+			high = np.array([[module_age_ranges[int(module[-1])][1] or np.inf] for module in provenance_modules], dtype=float)
+			distance = np.maximum(low - ages, 0) + np.maximum(ages - high, 0)
+			return [np.isnan(ages), np.nan_to_num(distance)] + latest
+		raise ValueError('Unknown ADOS policy %s' % self.policy)
+
+	def merge_block(self, block):
+		num_modules, num_samples, num_keys = len(provenance_modules), len(block), len(self.ados_keys)
+		values = np.full((num_modules, num_samples, num_keys), None, dtype=object)
+		present = np.zeros((num_modules, num_samples), dtype=bool)
+
+		groups = defaultdict(list)
+		for s, sample in enumerate(block):
+			for m, module in enumerate(provenance_modules):
+				if module in sample:
+					groups[(m, tuple(sample[module]))].append(s)
+		for (m, keys), rows in groups.items():
+			module = provenance_modules[m]
+			values[m, rows] = self.module_gather(module, keys).gather(module, [block[s][module] for s in rows])
+			present[m, rows] = True
+		observed = (values != None) & present[:, :, None]
+
+		# Rank the modules of every sample, modules a sample doesn't have come last
+		order = np.lexsort([key for key in reversed([~present] + self.policy_keys(values, observed))], axis=0)
+		rank = np.empty_like(order)
+		np.put_along_axis(rank, order, np.arange(num_modules)[:, None], axis=0)
+
+		# Each item from the best ranked module that answered it, everything else from the best ranked module
+		item_rank = np.where(observed[:, :, self.items], rank[:, :, None], num_modules)
+		choice = np.repeat(order[0][:, None], num_keys, axis=1)
+		choice[:, self.items] = item_rank.argmin(axis=0)
+		merged = values[choice, np.arange(num_samples)[:, None], np.arange(num_keys)[None, :]]
+		provenance = np.where(item_rank.min(axis=0) < num_modules, choice[:, self.items] + 1, 0).astype(np.uint8) + ord('0')
+
+		has_ados = np.flatnonzero(present.any(axis=0))
+		merged, provenance = merged[has_ados], provenance[has_ados]
+		instruments = [dict(zip(self.ados_keys, row)) for row in merged.tolist()]
+		self.validator.validate(merged, instruments)
+		for s, instrument, codes in zip(has_ados.tolist(), instruments, provenance):
+			block[s]['ADOS'] = instrument
+			block[s]['ADOS_provenance'] = codes.tobytes().decode('ascii')
+		return block
+
+# Samples are streamed through a block at a time
+def aggregate_ados(samples, policy='first'):
+	aggregator = AdosAggregator(schema_service.legacy_schema(), policy)
+	samples = iter(samples)
+	while True:
+		block = list(islice(samples, BLOCK_SIZE))
+		if len(block) == 0:
+			break
+		yield from aggregator.aggregate_block(block)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Aggregate the four ADOS modules into an ADOS instrument')
+	parser.add_argument('input_file')
+	parser.add_argument('output_file')
+	parser.add_argument('--json-array', action='store_true', help='write an indented json array instead of one sample per line')
+	parser.add_argument('--policy', choices=policies, default='first', help='how to choose between the ADOS modules of a sample')
+	args = parser.parse_args()
 
 	# Write json to file
-	with open(sys.argv[2], 'w+') as outfile:
-		print(len(samples))
-		json.dump(samples, outfile, sort_keys=True, indent=4)
+	print(write_samples(args.output_file, aggregate_ados(read_samples(args.input_file), args.policy), indent=args.json_array))
@@ -0,0 +1,102 @@
+import os
+import shutil
+
+from preprocessing.parse_cache import ParseCache, fingerprint
+
+# A content addressed cache for the outputs of the pipeline stages after stage 1, used by run_dag.py.
+#
+# A stage is keyed on its name, its parameters, the content of its code and the content of each of its inputs.
+# An entry maps that key to the content hashes of the files the stage wrote, and the files themselves are stored
+# once per distinct content in blobs/. So if assign_diagnosis.py changes but produces the same all_samples.json,
+# every stage after it is still a cache hit.
+#
+# The cache is kept under a size cap by evicting the least recently used entries (an entry's mtime is bumped
+# every time it's used) along with any stored files no other entry refers to.
+
+class ArtifactCache(ParseCache):
+	def __init__(self, cache_dir, max_bytes):
+		ParseCache.__init__(self, cache_dir, None)
+		self.max_bytes = max_bytes
+		os.makedirs(os.path.join(cache_dir, 'blobs'), exist_ok=True)
+
+	# Content hash of a file, or of every file in a directory
+	def content_hash(self, path):
+		if os.path.isdir(path):
+			return fingerprint([(os.path.relpath(os.path.join(dirpath, filename), path), self.file_hash(os.path.join(dirpath, filename)))
+				for dirpath, dirnames, filenames in sorted(os.walk(path)) for filename in sorted(filenames)])
+		return self.file_hash(path)
+
+	def stage_key(self, name, params, code, inputs):
+		return fingerprint(name, params, [self.content_hash(path) for path in code], [self.content_hash(path) for path in inputs])
+
+	# Copy the cached outputs of key into place. Returns False (and leaves the outputs alone)
+	# if there isn't an entry for key or any of its files have been evicted.
+	def restore(self, key, outputs):
+		hashes = self.get(key)
+		if hashes is None or len(hashes) != len(outputs) or not all(os.path.exists(self._blob_path(sha1)) for sha1 in hashes):
+			return False
+
+		for output, sha1 in zip(outputs, hashes):
+			# Files that are already up to date are left as they are
+			if os.path.exists(output) and self.file_hash(output) == sha1:
+				continue
+			tmp_path = '%s.%d.tmp' % (output, os.getpid())
+			shutil.copyfile(self._blob_path(sha1), tmp_path)
+			os.replace(tmp_path, output)
+			self.remember_hash(output, sha1)
+
+		os.utime(self._entry_path(key))
+		return True
+
+	# Store the outputs written by a stage under key
+	def store(self, key, outputs):
+		hashes = []
+		for output in outputs:
+			sha1 = self.file_hash(output)
+			if not os.path.exists(self._blob_path(sha1)):
+				tmp_path = '%s.%d.tmp' % (self._blob_path(sha1), os.getpid())
+				shutil.copyfile(output, tmp_path)
+				os.replace(tmp_path, self._blob_path(sha1))
+			hashes.append(sha1)
+		self.put(key, hashes)
+		self.evict(keep=key)
+
+	# Drop least recently used entries until the stored files fit under max_bytes
+	def evict(self, keep=None):
+		blob_dir = os.path.join(self.cache_dir, 'blobs')
+		sizes = {filename: os.path.getsize(os.path.join(blob_dir, filename)) for filename in os.listdir(blob_dir) if not filename.endswith('.tmp')}
+		total = sum(sizes.values())
+		if total <= self.max_bytes:
+			return
+
+		entry_dir = os.path.join(self.cache_dir, 'entries')
+		entries = {}
+		for filename in os.listdir(entry_dir):
+			if filename.endswith('.pickle'):
+				key = filename[:-len('.pickle')]
+				entries[key] = (os.path.getmtime(self._entry_path(key)), self.get(key) or [])
+
+		references = {}
+		for _, hashes in entries.values():
+			for sha1 in hashes:
+				references[sha1] = references.get(sha1, 0) + 1
+
+		for key in sorted(entries, key=lambda k: entries[k][0]):
+			if total <= self.max_bytes:
+				break
+			if key == keep:
+				continue
+			os.remove(self._entry_path(key))
+			for sha1 in entries[key][1]:
+				references[sha1] -= 1
+				if references[sha1] == 0 and sha1 in sizes:
+					os.remove(self._blob_path(sha1))
+					total -= sizes.pop(sha1)
+
+		# Stored files no entry refers to anymore
+		for sha1 in [sha1 for sha1 in sizes if references.get(sha1, 0) == 0]:
+			os.remove(self._blob_path(sha1))
+			total -= sizes.pop(sha1)
+
+	def _blob_path(self, sha1):
+		return os.path.join(self.cache_dir, 'blobs', sha1)
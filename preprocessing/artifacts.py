@@ -0,0 +1,97 @@
+import json
+import os
+
+# The all_samples_*.json files passed between stages of the pipeline hold a list of samples.
+# By default they're written as newline delimited json (one sample per line) so that each stage can read,
+# process and write one sample at a time instead of holding the full list in memory.
+# The indented json array written by earlier versions of the pipeline can still be produced with
+# indent=True (--json-array on the command line), and both formats can be read.
+
+CHUNK_SIZE = 1 << 20
+
+# Iterate over the samples in filename, in either format
+def read_samples(filename):
+	with open(filename, 'r') as f:
+		first = f.read(CHUNK_SIZE)
+		if first.lstrip().startswith('['):
+			yield from _read_array(f, first)
+		else:
+			lines = (first + f.readline()).splitlines()
+			for line in lines:
+				if line.strip() != '':
+					yield json.loads(line)
+			for line in f:
+				if line.strip() != '':
+					yield json.loads(line)
+
+# Incrementally decode a json array, one element at a time
+def _read_array(f, buf):
+	decoder = json.JSONDecoder()
+	eof = False
+	pos = buf.index('[') + 1
+	expect_value = True
+
+	while True:
+		# Skip whitespace, pulling in more of the file as needed
+		while pos < len(buf) and buf[pos].isspace():
+			pos += 1
+		if pos == len(buf):
+			if eof:
+				raise ValueError('Unexpected end of json array')
+			buf, pos = f.read(CHUNK_SIZE), 0
+			eof = buf == ''
+			continue
+
+		if buf[pos] == ']':
+			return
+		if not expect_value:
+			if buf[pos] != ',':
+				raise ValueError('Expected , or ] in json array, found %s' % buf[pos])
+			pos += 1
+			expect_value = True
+			continue
+
+		# The element may run past the end of the buffer, if so read more and try again
+		try:
+			value, end = decoder.raw_decode(buf, pos)
+		except json.JSONDecodeError:
+			if eof:
+				raise
+			end = None
+		if end is None or (end == len(buf) and not eof):
+			more = f.read(CHUNK_SIZE)
+			eof = more == ''
+			buf, pos = buf[pos:] + more, 0
+			continue
+
+		yield value
+		pos = end
+		expect_value = False
+
+		# Don't hold on to elements we've already decoded
+		if pos > CHUNK_SIZE:
+			buf, pos = buf[pos:], 0
+
+# Write samples (any iterable) to filename, returns the number of samples written.
+# With indent=True the output is identical to json.dump(samples, outfile, sort_keys=True, indent=4).
+# Compact instruments (see compact.py) are written as the dicts they stand in for.
+# The samples are written to a temporary file that replaces filename once it's complete, so a stage that fails
+# part way through never leaves a truncated file behind for the next stage (or the stage cache) to pick up.
+def write_samples(filename, samples, indent=False):
+	num_samples = 0
+	tmp_path = '%s.%d.tmp' % (filename, os.getpid())
+	with open(tmp_path, 'w+') as outfile:
+		if indent:
+			outfile.write('[')
+			for sample in samples:
+				outfile.write(',\n    ' if num_samples > 0 else '\n    ')
+				outfile.write(json.dumps(sample, sort_keys=True, indent=4, default=dict).replace('\n', '\n    '))
+				num_samples += 1
+			outfile.write('\n]' if num_samples > 0 else ']')
+		else:
+			for sample in samples:
+				outfile.write(json.dumps(sample, sort_keys=True, default=dict))
+				outfile.write('\n')
+				num_samples += 1
+	os.replace(tmp_path, filename)
+	return num_samples
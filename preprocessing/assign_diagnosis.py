@@ -1,12 +1,24 @@
+import argparse
 import json
 import jsonschema
 import sys
 from collections import defaultdict
+from collections.abc import Mapping
+from itertools import islice
+from os import path
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifacts import read_samples, write_samples
+from preprocessing.clinical_diagnoses import ClinicalDiagnosisMap, UNMAPPED
+from preprocessing.scoring import Algorithm, ByAge, Flag, IfFlag, Lookup, MaxOf, Rules, Subscore, Variants
+from preprocessing.telemetry import Telemetry
 
 # This script assigns a variety of diagnoses to each individual in the aggregated phenotype dataset.
 
 # Instrument diagnoses - each instrument is assigned a diagnosis based on item-level data using the 
-# diagnostic instructions provided for each instrument.
+# diagnostic instructions provided for each instrument. The instructions are written out as tables (the items
+# each subscore adds up and the cutoffs of each diagnosis) that are scored over a block of samples at once,
+# see scoring.py.
 
 # ADOS diagnosis - the aggregated ADOS instrument is assigned a diagnosis of Autism if any ADOS module
 # diagnosed autism for this individual. Otherwise, it is assigned a diagnosis of Autism Spectrum if
@@ -20,260 +32,172 @@ from collections import defaultdict
 
 # This code requires aggregate_phenotype.py and aggregate_ados.py to already have been run.
 # It outputs a file called all_samples.json which contains diagnoses for all instruments.
+# Raw clinical diagnoses that couldn't be mapped are counted in a report next to it (all_samples_report.json).
 # It is meant to be run as part of a multi-stage pipeline described in the README.
 
 # The code can be run with:
-# python3 assign_diagnosis.py
-
-def calculate_subscore(score_name, sample, instrument, features, additional_score_entries = [], calculate_score_f = lambda score_entries: sum([2 if x==3 else (0 if x>3 else x) for x in score_entries if x is not None])):
-	score_entries = [sample[instrument][key] for key in features]
-	score_entries.extend(additional_score_entries)
-	sample[instrument][score_name] = calculate_score_f(score_entries)
-	num_nulls = sum(x is None for x in score_entries)
-	return num_nulls
-
+# python3 assign_diagnosis.py input-file output-file [--json-array] [--clinical-diagnoses file] [--write-clinical-diagnoses file]
 
-def assign_adir2003_diagnosis(sample):
-	instrument = 'ADIR2003'
-	if instrument in sample:
+# Samples scored together
+BLOCK_SIZE = 4096
 
-		# Social interacton
-		a_num_nulls = 0
-		a_num_nulls += calculate_subscore('A1', sample, instrument, ['Q50.2', 'Q51.2', 'Q57.2'])
-		a_num_nulls += calculate_subscore('A2', sample, instrument, ['Q49.2', 'Q62.2', 'Q63.2'], 
-			additional_score_entries=[sample[instrument]['Q64.2'] if (sample[instrument]['age'] is None or sample[instrument]['age'] < 120) else sample[instrument]['Q65.2']])
-		a_num_nulls += calculate_subscore('A3', sample, instrument, ['Q52.2', 'Q53.2', 'Q54.2'])
-		a_num_nulls += calculate_subscore('A4', sample, instrument, ['Q31.2', 'Q55.2', 'Q56.2', 'Q58.2', 'Q59.2'])
+# The scoring algorithm of each instrument, see scoring.py. Subscores are listed in the order they're worked out,
+# and a subscore can add up ones listed before it.
 
-		calculate_subscore('social_interaction', sample, instrument, 
-			['A1', 'A2', 'A3', 'A4'], calculate_score_f=lambda score_entries: sum([x for x in score_entries if x is not None]))
+# ADIR2003 - is_verbal is Q30 == 0, and B2 and B3 are only scored for verbal subjects
+adir2003_algorithm = Algorithm('ADIR2003',
+	subscores=[
+		# Social interaction
+		Subscore('A1', ['Q50.2', 'Q51.2', 'Q57.2']),
+		Subscore('A2', ['Q49.2', 'Q62.2', 'Q63.2', ByAge('Q64.2', 'Q65.2', 120)]),
+		Subscore('A3', ['Q52.2', 'Q53.2', 'Q54.2']),
+		Subscore('A4', ['Q31.2', 'Q55.2', 'Q56.2', 'Q58.2', 'Q59.2']),
+		Subscore('social_interaction', ['A1', 'A2', 'A3', 'A4'], transform='sum'),
 
 		# Communication
-		is_verbal = None if sample[instrument]['Q30'] is None else (sample[instrument]['Q30'] == 0)
-
-		b_num_nulls = 0
-		b_num_nulls += calculate_subscore('B1', sample, instrument, ['Q42.2', 'Q43.2', 'Q44.2', 'Q45.2'])
-		b_num_nulls += calculate_subscore('B4', sample, instrument, ['Q47.2', 'Q68.2', 'Q61.2'])
-
-		if is_verbal is not None and is_verbal:
-			# If individual is verbal
-			b_num_nulls += calculate_subscore('B2', sample, instrument, ['Q34.2', 'Q35.2'])
-			b_num_nulls += calculate_subscore('B3', sample, instrument, ['Q33.2', 'Q36.2', 'Q37.2', 'Q37.2', 'Q38.2'])
-
-
-		calculate_subscore('communication', sample, instrument, 
-			['B1', 'B2', 'B3', 'B4'], calculate_score_f=lambda score_entries: sum([x for x in score_entries if x is not None]))
+		Subscore('B1', ['Q42.2', 'Q43.2', 'Q44.2', 'Q45.2']),
+		Subscore('B4', ['Q47.2', 'Q68.2', 'Q61.2']),
+		Subscore('B2', ['Q34.2', 'Q35.2'], when='is_verbal'),
+		Subscore('B3', ['Q33.2', 'Q36.2', 'Q37.2', 'Q37.2', 'Q38.2'], when='is_verbal'),
+		Subscore('communication', ['B1', 'B2', 'B3', 'B4'], transform='sum'),
 
 		# Restricted repetitive behavior
-		c_num_nulls = 0
-		c_num_nulls += calculate_subscore('C1', sample, instrument, ['Q67.2', 'Q68.2'])
-		c_num_nulls += calculate_subscore('C2', sample, instrument, ['Q70.2'],
-			additional_score_entries=[(sample[instrument]['Q39.2'] if is_verbal else 0)])
-		c_num_nulls += calculate_subscore('C3', sample, instrument, [],
-			additional_score_entries=[(sample[instrument]['Q77.2'] if sample[instrument]['Q78.2'] is None else (sample[instrument]['Q78.2'] if sample[instrument]['Q77.2'] is None else max(sample[instrument]['Q77.2'], sample[instrument]['Q78.2'])))])
-		c_num_nulls += calculate_subscore('C4', sample, instrument, [],
-			additional_score_entries=[(sample[instrument]['Q69.2'] if sample[instrument]['Q71.2'] is None else (sample[instrument]['Q71.2'] if sample[instrument]['Q69.2'] is None else max(sample[instrument]['Q69.2'], sample[instrument]['Q71.2'])))])
-
-		calculate_subscore('restricted_repetitive_behavior', sample, instrument, 
-			['C1', 'C2', 'C3', 'C4'], calculate_score_f=lambda score_entries: sum([x for x in score_entries if x is not None]))
+		Subscore('C1', ['Q67.2', 'Q68.2']),
+		Subscore('C2', ['Q70.2', IfFlag('is_verbal', 'Q39.2', 0)]),
+		Subscore('C3', [MaxOf('Q77.2', 'Q78.2')]),
+		Subscore('C4', [MaxOf('Q69.2', 'Q71.2')]),
+		Subscore('restricted_repetitive_behavior', ['C1', 'C2', 'C3', 'C4'], transform='sum'),
 
 		# Abnormality evident before 3 years
-		d_num_nulls = calculate_subscore('abnormality_evident_before_3_years', sample, instrument, 
-			['Q02', 'Q09', 'Q10', 'Q86', 'Q87'], 
-			calculate_score_f=lambda score_entries: sum([
-				(1 if score_entries[0] is not None and score_entries[0] < 36 else 0), 
-				(1 if score_entries[1] is not None and score_entries[1] > 24 else 0), 
-				(1 if score_entries[2] is not None and score_entries[2] > 33 else 0), 
-				(1 if score_entries[3] is not None and (score_entries[3] == 3 or score_entries[3] == 4) else 0), 
-				(1 if score_entries[4] is not None and score_entries[4] < 36 else 0)
-			]))
-
-		if (sample[instrument]['social_interaction'] >= 10) \
-			and (((is_verbal is None or is_verbal) and sample[instrument]['communication'] >= 8) or (not is_verbal and sample[instrument]['communication'] >= 7)) \
-			and (sample[instrument]['restricted_repetitive_behavior'] >= 3) \
-			and (sample[instrument]['abnormality_evident_before_3_years'] >= 1):
-			sample[instrument]['diagnosis'] = 'Autism'
-		else:
-			sample[instrument]['diagnosis'] = 'Control'
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls + c_num_nulls + d_num_nulls + (1 if is_verbal is None else 0)
-
-
-def assign_adosm1_diagnosis(sample):
-	instrument = 'ADOS_Module1'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA02', 'QA05', 'QA06', 'QA07', 'QA08'])
-		
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,  
-			['QB01', 'QB03', 'QB05', 'QB09', 'QB10', 'QB11', 'QB12'])
-
-		c_num_nulls = calculate_subscore('creativity', sample, instrument,  
-			['QC01', 'QC02'])
-
-		d_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,  
-			['QD01', 'QD02', 'QD04'])
-
-		if sample[instrument]['communication'] >= 4 and sample[instrument]['social_interaction'] >= 7 and sample[instrument]['communication']+sample[instrument]['social_interaction'] >= 12:
-			sample[instrument]['diagnosis'] = 'Autism'
-		elif sample[instrument]['communication'] >= 2 and sample[instrument]['social_interaction'] >= 4 and sample[instrument]['communication']+sample[instrument]['social_interaction'] >= 7:
-			sample[instrument]['diagnosis'] = 'Autism Spectrum'
-		else:
-			sample[instrument]['diagnosis'] = 'Control'
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls
-
-def assign_ados2m1_diagnosis(sample):
-	instrument = 'ADOS2_Module1'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA02', 'QA07', 'QA08'])
-		
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,  
-			['QB01', 'QB03', 'QB04', 'QB05', 'QB09', 'QB10', 'QB11', 'QB12'])
-
-		c_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,  
-			['QA03', 'QA05', 'QD01', 'QD02', 'QD04'])
-
-		has_words = sample[instrument]['QA01']
-		score = sample[instrument]['communication'] + sample[instrument]['social_interaction'] + sample[instrument]['restricted_repetitive_behavior']
-		if has_words is None or has_words >= 3:
-			sample[instrument]['diagnosis'] = 'Autism' if score >= 16 else ('Autism Spectrum' if score >= 11 else 'Control')
-		else:
-			sample[instrument]['diagnosis'] = 'Autism' if score >= 12 else ('Autism Spectrum' if score >= 8 else 'Control')
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls + c_num_nulls + (1 if has_words is None else 0)
-
-def assign_adosm2_diagnosis(sample):
-	instrument = 'ADOS_Module2'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA02', 'QA05', 'QA06', 'QA07', 'QA08'])
-
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,
-			['QB01', 'QB02', 'QB06', 'QB08', 'QB09', 'QB10', 'QB11'])
-
-		c_num_nulls = calculate_subscore('creativity', sample, instrument,
-			['QC02'])
-
-		d_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,
-			['QD01', 'QD02', 'QD04'])
-
-		if sample[instrument]['communication'] >= 5 and sample[instrument]['social_interaction'] >= 6 and sample[instrument]['communication']+sample[instrument]['social_interaction'] >= 12:
-			sample[instrument]['diagnosis'] = 'Autism'
-		elif sample[instrument]['communication'] >= 3 and sample[instrument]['social_interaction'] >= 4 and sample[instrument]['communication']+sample[instrument]['social_interaction'] >= 8:
-			sample[instrument]['diagnosis'] = 'Autism Spectrum'
-		else:
-			sample[instrument]['diagnosis'] = 'Control'
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls
-
-def assign_ados2m2_diagnosis(sample):
-	instrument = 'ADOS2_Module2'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA06', 'QA07'])
-
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,
-			['QB01', 'QB02', 'QB03', 'QB05', 'QB06', 'QB08', 'QB11', 'QB12'])
-
-		c_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,
-			['QA04', 'QD01', 'QD02', 'QD04'])
-
-		age = sample[instrument]['age']
-
-		score = sample[instrument]['communication'] + sample[instrument]['social_interaction'] + sample[instrument]['restricted_repetitive_behavior']		
-		if age is not None and age >= 60:
-			sample[instrument]['diagnosis'] = 'Autism' if score >= 9 else ('Autism Spectrum' if score >= 8 else 'Control')
-		else:
-			sample[instrument]['diagnosis'] = 'Autism' if score >= 10 else ('Autism Spectrum' if score >= 7 else 'Control')
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls + c_num_nulls + (1 if age is None else 0)
-
-def assign_adosm3_diagnosis(sample):
-	instrument = 'ADOS_Module3'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA04', 'QA07', 'QA08', 'QA09'])
-
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,
-			['QB01', 'QB02', 'QB06', 'QB07', 'QB08', 'QB09', 'QB10'])
-
-		c_num_nulls = calculate_subscore('creativity', sample, instrument,
-			['QC01'])
-		
-		d_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,
-			['QD01', 'QD02', 'QD04', 'QD05'])
-
-		if sample[instrument]['communication'] >= 3 and sample[instrument]['social_interaction'] >= 6 and sample[instrument]['communication']+sample[instrument]['social_interaction'] >= 10:
-			sample[instrument]['diagnosis'] = 'Autism'
-		elif sample[instrument]['communication'] >= 2 and sample[instrument]['social_interaction'] >= 4 and sample[instrument]['communication']+sample[instrument]['social_interaction'] >= 7:
-			sample[instrument]['diagnosis'] = 'Autism Spectrum'
-		else:
-			sample[instrument]['diagnosis'] = 'Control'
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls
-
-def assign_ados2m3_diagnosis(sample):
-	instrument = 'ADOS2_Module3'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA07', 'QA08', 'QA09'])
-
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,
-			['QB01', 'QB02', 'QB04', 'QB07', 'QB09', 'QB10', 'QB11'])
-		
-		c_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,
-			['QA04', 'QD01', 'QD02', 'QD04'])
-
-		score = sample[instrument]['communication'] + sample[instrument]['social_interaction'] + sample[instrument]['restricted_repetitive_behavior']		
-		sample[instrument]['diagnosis'] = 'Autism' if score >= 9 else ('Autism Spectrum' if score >= 7 else 'Control')
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls + c_num_nulls
-
-def assign_adosm4_diagnosis(sample):
-	instrument = 'ADOS_Module4'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA04', 'QA08', 'QA09', 'QA10'])
-
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,  
-			['QB01', 'QB02', 'QB06', 'QB08', 'QB09', 'QB10', 'QB11'])
-		
-		c_num_nulls = calculate_subscore('creativity', sample, instrument,
-			['QC01'])
-
-		d_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,
-			['QD01', 'QD02', 'QD04', 'QD05'])
-		
-		if sample[instrument]['communication'] >= 3 and sample[instrument]['social_interaction'] >= 6 and sample[instrument]['communication'] + sample[instrument]['social_interaction'] >= 10:
-			sample[instrument]['diagnosis'] = 'Autism'
-		elif sample[instrument]['communication'] >= 2 and sample[instrument]['social_interaction'] >= 4 and sample[instrument]['communication'] + sample[instrument]['social_interaction'] >= 7:
-			sample[instrument]['diagnosis'] = 'Autism Spectrum'
-		else:
-			sample[instrument]['diagnosis'] = 'Control'
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls + c_num_nulls
-
-def assign_ados2m4_diagnosis(sample):
-	instrument = 'ADOS2_Module4'
-	if instrument in sample:
-
-		a_num_nulls = calculate_subscore('communication', sample, instrument,  
-			['QA04', 'QA08', 'QA09', 'QA10'])
-
-		b_num_nulls = calculate_subscore('social_interaction', sample, instrument,  
-			['QB01', 'QB02', 'QB06', 'QB08', 'QB09', 'QB11', 'QB12'])
-
-		c_num_nulls = calculate_subscore('restricted_repetitive_behavior', sample, instrument,
-			['QD01', 'QD02', 'QD04', 'QD05'])
-		
-		if sample[instrument]['communication'] >= 3 and sample[instrument]['social_interaction'] >= 6 and sample[instrument]['communication'] + sample[instrument]['social_interaction'] >= 10:
-			sample[instrument]['diagnosis'] = 'Autism'
-		elif sample[instrument]['communication'] >= 2 and sample[instrument]['social_interaction'] >= 4 and sample[instrument]['communication'] + sample[instrument]['social_interaction'] >= 7:
-			sample[instrument]['diagnosis'] = 'Autism Spectrum'
-		else:
-			sample[instrument]['diagnosis'] = 'Control'
-		sample[instrument]['diagnosis_num_nulls'] = a_num_nulls + b_num_nulls + c_num_nulls
+		Subscore('abnormality_evident_before_3_years', ['Q02', 'Q09', 'Q10', 'Q86', 'Q87'],
+			tests=[('<', 36), ('>', 24), ('>', 33), ('in', [3, 4]), ('<', 36)]),
+	],
+	flags={'is_verbal': Flag('Q30', '==', 0)},
+	# Subjects who aren't verbal, or might not be, need a communication score of 7 rather than 8
+	diagnosis=Variants('is_verbal', {
+		True: Rules([('Autism', {'social_interaction': 10, 'communication': 8, 'restricted_repetitive_behavior': 3, 'abnormality_evident_before_3_years': 1})]),
+		False: Rules([('Autism', {'social_interaction': 10, 'communication': 7, 'restricted_repetitive_behavior': 3, 'abnormality_evident_before_3_years': 1})]),
+	}),
+	nulls=['A1', 'A2', 'A3', 'A4', 'B1', 'B2', 'B3', 'B4', 'C1', 'C2', 'C3', 'C4', 'abnormality_evident_before_3_years'],
+	flag_nulls=['is_verbal'])
+
+adosm1_algorithm = Algorithm('ADOS_Module1',
+	subscores=[
+		Subscore('communication', ['QA02', 'QA05', 'QA06', 'QA07', 'QA08']),
+		Subscore('social_interaction', ['QB01', 'QB03', 'QB05', 'QB09', 'QB10', 'QB11', 'QB12']),
+		Subscore('creativity', ['QC01', 'QC02']),
+		Subscore('restricted_repetitive_behavior', ['QD01', 'QD02', 'QD04']),
+	],
+	diagnosis=Rules([
+		('Autism', {'communication': 4, 'social_interaction': 7, 'communication+social_interaction': 12}),
+		('Autism Spectrum', {'communication': 2, 'social_interaction': 4, 'communication+social_interaction': 7}),
+	]),
+	nulls=['communication', 'social_interaction'])
+
+# ADOS-2 module 1 has different cutoffs for subjects with few to no words (QA01 of 3 or more is few or none)
+ados2m1_algorithm = Algorithm('ADOS2_Module1',
+	subscores=[
+		Subscore('communication', ['QA02', 'QA07', 'QA08']),
+		Subscore('social_interaction', ['QB01', 'QB03', 'QB04', 'QB05', 'QB09', 'QB10', 'QB11', 'QB12']),
+		Subscore('restricted_repetitive_behavior', ['QA03', 'QA05', 'QD01', 'QD02', 'QD04']),
+	],
+	flags={'some_words': Flag('QA01', '<', 3)},
+	diagnosis=Variants('some_words', {
+		False: Rules([
+			('Autism', {'communication+social_interaction+restricted_repetitive_behavior': 16}),
+			('Autism Spectrum', {'communication+social_interaction+restricted_repetitive_behavior': 11}),
+		]),
+		True: Rules([
+			('Autism', {'communication+social_interaction+restricted_repetitive_behavior': 12}),
+			('Autism Spectrum', {'communication+social_interaction+restricted_repetitive_behavior': 8}),
+		]),
+	}),
+	nulls=['communication', 'social_interaction', 'restricted_repetitive_behavior'],
+	flag_nulls=['some_words'])
+
+adosm2_algorithm = Algorithm('ADOS_Module2',
+	subscores=[
+		Subscore('communication', ['QA02', 'QA05', 'QA06', 'QA07', 'QA08']),
+		Subscore('social_interaction', ['QB01', 'QB02', 'QB06', 'QB08', 'QB09', 'QB10', 'QB11']),
+		Subscore('creativity', ['QC02']),
+		Subscore('restricted_repetitive_behavior', ['QD01', 'QD02', 'QD04']),
+	],
+	diagnosis=Rules([
+		('Autism', {'communication': 5, 'social_interaction': 6, 'communication+social_interaction': 12}),
+		('Autism Spectrum', {'communication': 3, 'social_interaction': 4, 'communication+social_interaction': 8}),
+	]),
+	nulls=['communication', 'social_interaction'])
+
+# ADOS-2 module 2 has different cutoffs from 5 years old
+ados2m2_algorithm = Algorithm('ADOS2_Module2',
+	subscores=[
+		Subscore('communication', ['QA06', 'QA07']),
+		Subscore('social_interaction', ['QB01', 'QB02', 'QB03', 'QB05', 'QB06', 'QB08', 'QB11', 'QB12']),
+		Subscore('restricted_repetitive_behavior', ['QA04', 'QD01', 'QD02', 'QD04']),
+	],
+	flags={'five_or_older': Flag('age', '>=', 60)},
+	diagnosis=Variants('five_or_older', {
+		True: Rules([
+			('Autism', {'communication+social_interaction+restricted_repetitive_behavior': 9}),
+			('Autism Spectrum', {'communication+social_interaction+restricted_repetitive_behavior': 8}),
+		]),
+		False: Rules([
+			('Autism', {'communication+social_interaction+restricted_repetitive_behavior': 10}),
+			('Autism Spectrum', {'communication+social_interaction+restricted_repetitive_behavior': 7}),
+		]),
+	}),
+	nulls=['communication', 'social_interaction', 'restricted_repetitive_behavior'],
+	flag_nulls=['five_or_older'])
+
+adosm3_algorithm = Algorithm('ADOS_Module3',
+	subscores=[
+		Subscore('communication', ['QA04', 'QA07', 'QA08', 'QA09']),
+		Subscore('social_interaction', ['QB01', 'QB02', 'QB06', 'QB07', 'QB08', 'QB09', 'QB10']),
+		Subscore('creativity', ['QC01']),
+		Subscore('restricted_repetitive_behavior', ['QD01', 'QD02', 'QD04', 'QD05']),
+	],
+	diagnosis=Rules([
+		('Autism', {'communication': 3, 'social_interaction': 6, 'communication+social_interaction': 10}),
+		('Autism Spectrum', {'communication': 2, 'social_interaction': 4, 'communication+social_interaction': 7}),
+	]),
+	nulls=['communication', 'social_interaction'])
+
+ados2m3_algorithm = Algorithm('ADOS2_Module3',
+	subscores=[
+		Subscore('communication', ['QA07', 'QA08', 'QA09']),
+		Subscore('social_interaction', ['QB01', 'QB02', 'QB04', 'QB07', 'QB09', 'QB10', 'QB11']),
+		Subscore('restricted_repetitive_behavior', ['QA04', 'QD01', 'QD02', 'QD04']),
+	],
+	diagnosis=Rules([
+		('Autism', {'communication+social_interaction+restricted_repetitive_behavior': 9}),
+		('Autism Spectrum', {'communication+social_interaction+restricted_repetitive_behavior': 7}),
+	]),
+	nulls=['communication', 'social_interaction', 'restricted_repetitive_behavior'])
+
+adosm4_algorithm = Algorithm('ADOS_Module4',
+	subscores=[
+		Subscore('communication', ['QA04', 'QA08', 'QA09', 'QA10']),
+		Subscore('social_interaction', ['QB01', 'QB02', 'QB06', 'QB08', 'QB09', 'QB10', 'QB11']),
+		Subscore('creativity', ['QC01']),
+		Subscore('restricted_repetitive_behavior', ['QD01', 'QD02', 'QD04', 'QD05']),
+	],
+	diagnosis=Rules([
+		('Autism', {'communication': 3, 'social_interaction': 6, 'communication+social_interaction': 10}),
+		('Autism Spectrum', {'communication': 2, 'social_interaction': 4, 'communication+social_interaction': 7}),
+	]),
+	nulls=['communication', 'social_interaction', 'creativity'])
+
+ados2m4_algorithm = Algorithm('ADOS2_Module4',
+	subscores=[
+		Subscore('communication', ['QA04', 'QA08', 'QA09', 'QA10']),
+		Subscore('social_interaction', ['QB01', 'QB02', 'QB06', 'QB08', 'QB09', 'QB11', 'QB12']),
+		Subscore('restricted_repetitive_behavior', ['QD01', 'QD02', 'QD04', 'QD05']),
+	],
+	diagnosis=Rules([
+		('Autism', {'communication': 3, 'social_interaction': 6, 'communication+social_interaction': 10}),
+		('Autism Spectrum', {'communication': 2, 'social_interaction': 4, 'communication+social_interaction': 7}),
+	]),
+	nulls=['communication', 'social_interaction', 'restricted_repetitive_behavior'])
 
 srs_male = [34, 34, 35, 35, 36, 36, 37, 37, 38, 38, 
 			39, 39, 40, 40, 41, 41, 42, 42, 42, 43, 
@@ -317,42 +241,54 @@ srs_female = [35, 35, 36, 36, 37, 38, 38, 39, 39, 40,
 			134, 135, 135, 136, 136, 137, 138, 138, 139, 139, 
 			140, 140, 141, 141, 142, 142]
 
-def assign_srs_diagnosis(sample):
-	instrument = 'SRS_Child'
-	if instrument in sample:
-
-		awa_num_nulls = calculate_subscore('social_awareness', sample, instrument,  
-			['Q02', 'Q07', 'Q25', 'Q32', 'Q45', 'Q52', 'Q54', 'Q56'])
-
-		cog_num_nulls = calculate_subscore('social_cognition', sample, instrument,  
-			['Q05', 'Q10', 'Q15', 'Q17', 'Q30', 'Q40', 'Q42', 'Q44', 'Q48',
-			'Q58', 'Q59', 'Q62'])
-
-		com_num_nulls = calculate_subscore('social_communication', sample, instrument,
-			['Q12', 'Q13', 'Q16', 'Q18', 'Q19', 'Q21', 'Q22', 'Q26', 'Q33', 
-			'Q35', 'Q36', 'Q37', 'Q38', 'Q41', 'Q46', 'Q47', 'Q51', 'Q53',
-			'Q55', 'Q57', 'Q60', 'Q61'])
-
-		mot_num_nulls = calculate_subscore('social_motivation', sample, instrument,
-			['Q01', 'Q03', 'Q06', 'Q09', 'Q11', 'Q23', 'Q27', 'Q34', 'Q43', 
-			'Q64', 'Q65'])
-
-		man_num_nulls = calculate_subscore('autistic_mannerisms', sample, instrument,
-			['Q04', 'Q08', 'Q14', 'Q20', 'Q24', 'Q28', 'Q29', 'Q31', 'Q39', 
-			'Q49', 'Q50', 'Q63'])
-
-		sample[instrument]['total_raw_score'] = sample[instrument]['social_awareness'] + sample[instrument]['social_cognition']  + \
-		sample[instrument]['social_communication']  + sample[instrument]['social_motivation']  + sample[instrument]['autistic_mannerisms'] 
-		
-		if sample['gender'] is not None:
-			if sample['gender'] == 'Male':
-				sample[instrument]['total_t_score'] = srs_male[sample[instrument]['total_raw_score']]
-			else:
-				sample[instrument]['total_t_score'] = srs_female[sample[instrument]['total_raw_score']]
-
-			sample[instrument]['diagnosis'] = 'Autism' if sample[instrument]['total_t_score'] >= 76 else 'Autism Spectrum' if sample[instrument]['total_t_score'] >= 60 else 'Control'
-
-		sample[instrument]['diagnosis_num_nulls'] = awa_num_nulls + cog_num_nulls + com_num_nulls + mot_num_nulls + man_num_nulls
+# SRS - the five subscales add up the same items on every form of the SRS, the total raw score is their sum, and
+# its T-score depends on gender. Subjects of unknown gender don't get a diagnosis.
+srs_subscales = [
+	('social_awareness', ['Q02', 'Q07', 'Q25', 'Q32', 'Q45', 'Q52', 'Q54', 'Q56']),
+	('social_cognition', ['Q05', 'Q10', 'Q15', 'Q17', 'Q30', 'Q40', 'Q42', 'Q44', 'Q48',
+		'Q58', 'Q59', 'Q62']),
+	('social_communication', ['Q12', 'Q13', 'Q16', 'Q18', 'Q19', 'Q21', 'Q22', 'Q26', 'Q33',
+		'Q35', 'Q36', 'Q37', 'Q38', 'Q41', 'Q46', 'Q47', 'Q51', 'Q53',
+		'Q55', 'Q57', 'Q60', 'Q61']),
+	('social_motivation', ['Q01', 'Q03', 'Q06', 'Q09', 'Q11', 'Q23', 'Q27', 'Q34', 'Q43',
+		'Q64', 'Q65']),
+	('autistic_mannerisms', ['Q04', 'Q08', 'Q14', 'Q20', 'Q24', 'Q28', 'Q29', 'Q31', 'Q39',
+		'Q49', 'Q50', 'Q63']),
+]
+
+# The algorithm of an SRS form given its T-score tables (indexed by total raw score). SRS_Adult and SRS_Preschool
+# can be scored the same way once we have their tables (their scores also need adding to instrument_to_scores in
+# aggregate_phenotype.py).
+def srs_form(instrument, male, female):
+	names = [name for name, _ in srs_subscales]
+	return Algorithm(instrument,
+		subscores=[Subscore(name, items) for name, items in srs_subscales] + [Subscore('total_raw_score', names, transform='sum')],
+		lookups=[Lookup('total_t_score', 'total_raw_score', 'gender', {'Male': male}, default=female)],
+		diagnosis=Rules([
+			('Autism', {'total_t_score': 76}),
+			('Autism Spectrum', {'total_t_score': 60}),
+		]),
+		nulls=names)
+
+srs_algorithm = srs_form('SRS_Child', srs_male, srs_female)
+
+algorithms = [
+	adir2003_algorithm,
+	adosm1_algorithm, adosm2_algorithm, adosm3_algorithm, adosm4_algorithm,
+	ados2m1_algorithm, ados2m2_algorithm, ados2m3_algorithm, ados2m4_algorithm,
+	srs_algorithm,
+]
+scored_instruments = frozenset(algorithm.instrument for algorithm in algorithms)
+
+# Score every instrument of a block of samples, algorithm by algorithm
+def score_instruments(samples):
+	scored = defaultdict(list)
+	for sample in samples:
+		for instrument in scored_instruments.intersection(sample):
+			scored[instrument].append(sample)
+	for algorithm in algorithms:
+		instrument_samples = scored[algorithm.instrument]
+		algorithm.apply([sample[algorithm.instrument] for sample in instrument_samples], instrument_samples)
 
 
 def assign_cpea_diagnosis(sample):
@@ -418,41 +354,22 @@ def assign_diagnosis(sample):
 
 	sample['diagnosis'] = 'Autism' if has_autism else 'Control'
 
+# Raw clinical diagnoses we don't have a mapping for, written to a report next to the output instead of being printed
+telemetry = Telemetry({'unmapped_clinical_diagnoses': ('dataset', 'clinical_diagnosis_raw')})
+
+# Each distinct raw clinical diagnosis is only matched once, see clinical_diagnoses.py
+clinical_diagnoses = ClinicalDiagnosisMap()
+
 def assign_clinical_diagnosis(sample):
 	if sample['clinical_diagnosis_raw'] is not None:
-		cd = sample['clinical_diagnosis_raw'].lower()
-		if cd == '':
-			sample['clinical_diagnosis'] = None
-		elif 'aut' in cd or '299' in cd or 'asd' in cd or cd in ['proband', 'asd', 'affected sibling', 'ad', 'affected']:
-			sample['clinical_diagnosis'] = 'Autism'
-		elif 'nqa' in cd or cd == 'broadspectrum':
-			sample['clinical_diagnosis'] = 'NQA'
-		elif 'asperger' in cd:
-			sample['clinical_diagnosis'] =  'Asperger'
-		elif cd in ['not met', 'unaffected', 'typical', 'unaffected sibling', 'primary caregiver 1', 'primary caregiver 2'] or 'control' in cd:
-			sample['clinical_diagnosis'] =  'Control'
-		elif 'pdd' in cd or 'nos' in cd or 'pervasive developmental disorder' in cd or cd == 'pervasive development disorder - not otherwise specified':
-			sample['clinical_diagnosis'] = 'PDD-NOS'
-		elif cd in ['not defined', 'fragile x']:
-			sample['clinical_diagnosis'] = None
+		label = clinical_diagnoses.label(sample['clinical_diagnosis_raw'])
+		if label is UNMAPPED:
+			telemetry.count('unmapped_clinical_diagnoses', (sample['dataset'], sample['clinical_diagnosis_raw'].lower()))
 		else:
-			print(sample['dataset'], sample['identifier'], cd)
+			sample['clinical_diagnosis'] = label
 
+# Everything but the instrument diagnoses, which are assigned a block at a time by score_instruments
 def assign_all_diagnoses(sample):
-	assign_adir2003_diagnosis(sample)
-
-	assign_adosm1_diagnosis(sample)
-	assign_adosm2_diagnosis(sample)
-	assign_adosm3_diagnosis(sample)
-	assign_adosm4_diagnosis(sample)
-	
-	assign_ados2m1_diagnosis(sample)
-	assign_ados2m2_diagnosis(sample)
-	assign_ados2m3_diagnosis(sample)
-	assign_ados2m4_diagnosis(sample)
-
-	assign_srs_diagnosis(sample)
-
 	assign_cpea_diagnosis(sample)
 	assign_cpea_adjusted_diagnosis(sample)
 
@@ -460,44 +377,96 @@ def assign_all_diagnoses(sample):
 	# assign_diagnosis(sample)
 
 from collections import Counter
-if __name__ == '__main__':
-	# Load schema
-	with open("AutismPhenotype.json") as schema_file:    
-		pheno_schema = json.load(schema_file)
-
-	with open(sys.argv[1], 'r') as infile:
 
-		# Read in samples
-		samples = json.load(infile)
-
-		# Diagnose
-		for sample in samples:
+diag_keys = ['clinical_diagnosis', 'cpea_diagnosis', 'cpea_adjusted_diagnosis']
+counted_instruments = ['ADIR2003', 
+	'ADOS_Module1', 'ADOS_Module2', 'ADOS_Module3', 'ADOS_Module4',
+	'ADOS2_Module1', 'ADOS2_Module2', 'ADOS2_Module3', 'ADOS2_Module4',
+	'SRS_Child'
+	]
+
+def new_counts():
+	return dict([(key, Counter()) for key in diag_keys + counted_instruments])
+
+def print_counts(counts):
+	for key in diag_keys + counted_instruments:
+		print(key)
+		print(counts[key])
+
+# Samples are streamed through a block at a time, diagnosis counts are added to counts as we go
+def assign_diagnoses(samples, counts):
+	samples = iter(samples)
+	while True:
+		block = list(islice(samples, BLOCK_SIZE))
+		if len(block) == 0:
+			break
+		score_instruments(block)
+
+		for sample in block:
 			# Assign diagnoses
 			assign_all_diagnoses(sample)
 
 			# Validate schema
 			#jsonschema.validate(sample, pheno_schema)
 
-		# Print counts
-		diag_keys = ['clinical_diagnosis', 'cpea_diagnosis', 'cpea_adjusted_diagnosis']
-
-		for key in diag_keys:
-			print(key)
-			print(Counter([s[key] for s in samples]))
+			for key in diag_keys:
+				counts[key][sample[key]] += 1
+			for instrument in counted_instruments:
+				counts[instrument][None if instrument not in sample else sample[instrument]['diagnosis']] += 1
+
+			yield sample
+
+# Rescoring samples that already have their diagnoses (e.g. read from all_samples.json) with some of the algorithms
+# changed, for trying out other cutoffs. Only the instruments of the changed algorithms are scored again, everything
+# else is left as it is. The CPEA diagnoses read ADIR and ADOS, which no algorithm scores (ADOS is copied from its
+# module by aggregate_ados.py before this stage runs), so they never change with a rescore.
+# The samples are indexed by instrument once, so each rescore only touches the rows it needs.
+#
+#     rescorer = Rescorer(list(read_samples('../data/all_samples.json')))
+#     changes = rescorer.rescore([ados2m3_algorithm.replace(diagnosis=Rules([('Autism', {...}), ...]))])
+#     rescorer.rescore([ados2m3_algorithm])  # back to the published cutoffs
+class Rescorer:
+	def __init__(self, samples):
+		self.samples = defaultdict(list)
+		for sample in samples:
+			for instrument, value in sample.items():
+				if isinstance(value, Mapping):
+					self.samples[instrument].append(sample)
+
+	# Score the instruments of algorithms again, returns the labels that changed as
+	# (identifier, instrument, before, after) tuples
+	def rescore(self, algorithms):
+		changes = []
+		for algorithm in algorithms:
+			samples = self.samples[algorithm.instrument]
+			rows = [sample[algorithm.instrument] for sample in samples]
+			before = [row.get('diagnosis') for row in rows]
+			algorithm.apply(rows, samples)
+			changes += [(sample['identifier'], algorithm.instrument, old, row.get('diagnosis'))
+				for sample, row, old in zip(samples, rows, before) if row.get('diagnosis') != old]
+		return changes
 
-		for instrument in ['ADIR2003', 
-		'ADOS_Module1', 'ADOS_Module2', 'ADOS_Module3', 'ADOS_Module4',
-		'ADOS2_Module1', 'ADOS2_Module2', 'ADOS2_Module3', 'ADOS2_Module4',
-		'SRS_Child'
-		]:
-			print(instrument)
-			print(Counter([None if instrument not in s else s[instrument]['diagnosis'] for s in samples]))
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Assign diagnoses to each instrument')
+	parser.add_argument('input_file')
+	parser.add_argument('output_file')
+	parser.add_argument('--json-array', action='store_true', help='write an indented json array instead of one sample per line')
+	parser.add_argument('--clinical-diagnoses', action='append', default=[], help='reviewed table of raw clinical diagnoses to read')
+	parser.add_argument('--write-clinical-diagnoses', help='where to write every raw clinical diagnosis seen with its label, for review')
+	args = parser.parse_args()
 
-		# Write to file
-		with open(sys.argv[2], 'w+') as outfile:
-			json.dump(samples, outfile, sort_keys=True, indent=4)
+	for filename in args.clinical_diagnoses:
+		clinical_diagnoses.load(filename)
 
-		
+	# Load schema
+	with open("AutismPhenotype.json") as schema_file:    
+		pheno_schema = json.load(schema_file)
 
-		
+	# Diagnose and write to file
+	counts = new_counts()
+	write_samples(args.output_file, assign_diagnoses(read_samples(args.input_file), counts), indent=args.json_array)
 
+	print_counts(counts)
+	telemetry.write_report(path.splitext(args.output_file)[0] + '_report.json')
+	if args.write_clinical_diagnoses is not None:
+		clinical_diagnoses.write(args.write_clinical_diagnoses)
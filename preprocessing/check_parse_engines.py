@@ -0,0 +1,69 @@
+import sys
+from os import path
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.aggregate_phenotype import apply_rows, exclusions, instrument_to_codes, parse_engines, srs_transform
+
+# Checks that the parse engines of aggregate_phenotype.py (columnar, the default, and rows) give the same rows
+# and the same telemetry events for the small raw files in fixtures/parse_engines. Between them the files have
+# missing values, answers remapped by instrument_to_exceptions, coded answers, answers that need rounding,
+# srs_transform, columns split over two columns (one longer than expected) and items without a column.
+# unreadable.csv also has rows with an answer that isn't a number or too few columns, which should come out with
+# values of None and only be accepted by apply_rows for identifiers that are excluded.
+
+# The code can be run with:
+# python3 check_parse_engines.py
+
+directory = 'fixtures/parse_engines'
+
+def optional(column):
+	return lambda pieces: pieces[column] if pieces[column] != '' else None
+
+lambdas = {'identifier': optional(0), 'age': lambda pieces: int(pieces[1]) if pieces[1] != '' else None, 'gender': optional(2)}
+
+# (file, instrument, column map, header lines, delimiter, value transform)
+fixtures = [
+	('ados_module3.csv', 'ADOS_Module3', {'QA01': 3, 'QA02': 4, 'QB04': 5, 'QB05': 6, 'QD02': (7, 8), 'QD03': (9, 8, 7), 'QE01': None, 'QA09': 10},
+		1, ',', None),
+	('srs_child.txt', 'SRS_Child', {'Q01': 3, 'Q02': 4, 'Q03': 5, 'Q07': 6, 'Q11': None}, 2, '\t', srs_transform),
+	('adir2003.csv', 'ADIR2003', {'Q04': 3, 'Q05': 4, 'Q11': 5, 'Q20': 6, 'Q29.1': (7, 8)}, 1, ',', None),
+	# Every item is mapped so that apply_rows writes valid instruments
+	('unreadable.csv', 'ADOS_Module3', dict(dict.fromkeys(instrument_to_codes['ADOS_Module3']), QA01=3, QA02=4, QB05=5, QD02=(6, 7)), 1, ',', None),
+]
+
+unreadable = ['BAD1', 'SHORT1', 'BAD2']
+
+if __name__ == '__main__':
+	seen = {'remaps': 0, 'missing': 0, 'warnings': 0}
+	for filename, instrument, cols, num_headers, delimiter, value_transform in fixtures:
+		parsed = {}
+		for engine, parse in sorted(parse_engines.items()):
+			parsed[engine] = parse(directory, filename, instrument, lambdas, cols, num_headers, delimiter, value_transform)
+		(rows, events), (columnar_rows, columnar_events) = parsed['rows'], parsed['columnar']
+
+		assert len(rows) > 0, filename
+		for row, columnar_row in zip(rows, columnar_rows):
+			assert row == columnar_row, (filename, row, columnar_row)
+		assert len(rows) == len(columnar_rows), filename
+		assert events == columnar_events, (filename, events, columnar_events)
+		for section, counts in events.items():
+			seen[section] += sum(counts.values())
+		print('%s: %d rows, %s' % (filename, len(rows), ', '.join('%d %s' % (sum(events[section].values()), section) for section in sorted(events))))
+
+	# Make sure the fixtures still exercise everything the engines do with an answer
+	assert all(n > 0 for n in seen.values()), seen
+
+	# Unread rows stop stage 1 unless their identifiers are excluded
+	rows = parsed['columnar'][0]
+	assert [identifier for identifier, info, values in rows if values is None] == unreadable, rows
+	try:
+		apply_rows({}, rows, 'Fixtures', 'ADOS_Module3', filename='unreadable.csv')
+		raise AssertionError('apply_rows accepted unread rows')
+	except ValueError:
+		pass
+	for identifier in unreadable:
+		exclusions.add('Fixtures', identifier)
+	identifier_to_samples = {}
+	apply_rows(identifier_to_samples, rows, 'Fixtures', 'ADOS_Module3', filename='unreadable.csv')
+	assert sorted(identifier for identifier, sample in identifier_to_samples.items() if 'ADOS_Module3' in sample) == ['GOOD1', 'GOOD2', 'SHORT2']
+	print('Parse engines agree')
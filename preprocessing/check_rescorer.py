@@ -0,0 +1,47 @@
+import sys
+from os import path
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.assign_diagnosis import Rescorer, ados2m3_algorithm, score_instruments
+from preprocessing.scoring import Rules
+
+# Checks that rescoring with a changed cutoff changes exactly the labels it should, and that rescoring with the
+# published cutoffs changes them back. The samples are made up: one ADOS-2 Module 3 per total score from 0 to 14
+# (the sum of the communication, social_interaction and restricted_repetitive_behavior subscores).
+# The published cutoffs are Autism from 9 and Autism Spectrum from 7, raising the Autism cutoff to 11 should turn
+# the samples with totals of 9 and 10 from Autism into Autism Spectrum and leave every other label alone.
+
+# The code can be run with:
+# python3 check_rescorer.py
+
+def make_samples():
+	samples = []
+	for total in range(15):
+		instrument = dict.fromkeys(ados2m3_algorithm.keys, 0)
+		# Items score at most 2, spread the total over as many items as it takes
+		for key, score in zip(ados2m3_algorithm.keys, [2] * (total // 2) + [total % 2]):
+			instrument[key] = score
+		samples.append({'identifier': 'total%02d' % total, 'ADOS2_Module3': instrument})
+	return samples
+
+if __name__ == '__main__':
+	samples = make_samples()
+	score_instruments(samples)
+	published = [sample['ADOS2_Module3']['diagnosis'] for sample in samples]
+	expected = ['Control'] * 7 + ['Autism Spectrum'] * 2 + ['Autism'] * 6
+	assert published == expected, published
+
+	rescorer = Rescorer(samples)
+	raised = ados2m3_algorithm.replace(diagnosis=Rules([
+		('Autism', {'communication+social_interaction+restricted_repetitive_behavior': 11}),
+		('Autism Spectrum', {'communication+social_interaction+restricted_repetitive_behavior': 7}),
+	]))
+	changes = rescorer.rescore([raised])
+	assert sorted(changes) == [('total09', 'ADOS2_Module3', 'Autism', 'Autism Spectrum'),
+		('total10', 'ADOS2_Module3', 'Autism', 'Autism Spectrum')], changes
+
+	changes = rescorer.rescore([ados2m3_algorithm])
+	assert sorted(changes) == [('total09', 'ADOS2_Module3', 'Autism Spectrum', 'Autism'),
+		('total10', 'ADOS2_Module3', 'Autism Spectrum', 'Autism')], changes
+	assert [sample['ADOS2_Module3']['diagnosis'] for sample in samples] == published
+	print('Rescorer changed the expected labels')
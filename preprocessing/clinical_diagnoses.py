@@ -0,0 +1,81 @@
+import json
+from collections import Counter
+
+# Maps the free text clinical_diagnosis_raw of a sample to a clinical_diagnosis (Autism, Asperger, PDD-NOS, NQA,
+# Control or None). The same few hundred raw strings come up over and over, so each distinct string is only
+# matched once and its label is remembered, after that a sample costs a dict lookup.
+#
+# Strings are matched against a reviewed table first (lower case raw string -> label, read with load), then
+# against the substring rules in match_rules. Strings neither of them maps are counted, and write saves every
+# string seen with its label along with the unmapped ones and how often they came up, e.g.
+#     {"mapped": {"affected": "Autism", "not defined": null, ...},
+#     "unmapped": {"speech delay": 12, ...}}
+# Once the unmapped strings have been looked at they can be moved into mapped and the file loaded on the next run.
+
+# Returned for strings with no mapping, None is a label ("not defined" is mapped to None)
+UNMAPPED = object()
+NOT_SEEN = object()
+
+# Distinct raw strings remembered, more than any cohort we have
+MEMO_SIZE = 65536
+
+# The label of a lower case raw string
+def match_rules(cd):
+	if cd == '':
+		return None
+	elif 'aut' in cd or '299' in cd or 'asd' in cd or cd in ['proband', 'asd', 'affected sibling', 'ad', 'affected']:
+		return 'Autism'
+	elif 'nqa' in cd or cd == 'broadspectrum':
+		return 'NQA'
+	elif 'asperger' in cd:
+		return 'Asperger'
+	elif cd in ['not met', 'unaffected', 'typical', 'unaffected sibling', 'primary caregiver 1', 'primary caregiver 2'] or 'control' in cd:
+		return 'Control'
+	elif 'pdd' in cd or 'nos' in cd or 'pervasive developmental disorder' in cd or cd == 'pervasive development disorder - not otherwise specified':
+		return 'PDD-NOS'
+	elif cd in ['not defined', 'fragile x']:
+		return None
+	return UNMAPPED
+
+class ClinicalDiagnosisMap:
+	def __init__(self, table=None, memo_size=MEMO_SIZE):
+		self.table = dict(table or {})
+		self.memo_size = memo_size
+		self.memo = {}
+		self.unmapped = Counter()
+
+	# Add a reviewed table written by write (only its mapped strings are read)
+	def load(self, filename):
+		with open(filename) as f:
+			self.table.update(json.load(f)['mapped'])
+		self.memo = {}
+
+	# The label of a raw string, or UNMAPPED
+	def label(self, raw):
+		label = self.memo.get(raw, NOT_SEEN)
+		if label is NOT_SEEN:
+			cd = raw.lower()
+			label = self.table[cd] if cd in self.table else match_rules(cd)
+			if len(self.memo) < self.memo_size:
+				self.memo[raw] = label
+		if label is UNMAPPED:
+			self.unmapped[raw.lower()] += 1
+		return label
+
+	# Every string seen (and every string of the loaded tables) with its label, and how often unmapped strings came up
+	def mapping(self):
+		mapped = dict(self.table)
+		for raw, label in self.memo.items():
+			if label is not UNMAPPED:
+				mapped[raw.lower()] = label
+		return {'mapped': dict(sorted(mapped.items())), 'unmapped': dict(sorted(self.unmapped.items()))}
+
+	# One string per line
+	def write(self, filename):
+		mapping = self.mapping()
+		with open(filename, 'w+') as f:
+			f.write('{"mapped": {')
+			f.write(','.join('\n\t%s: %s' % (json.dumps(cd), json.dumps(label)) for cd, label in mapping['mapped'].items()))
+			f.write('\n},\n"unmapped": {')
+			f.write(','.join('\n\t%s: %d' % (json.dumps(cd), count) for cd, count in mapping['unmapped'].items()))
+			f.write('\n}}\n')
@@ -0,0 +1,238 @@
+import argparse
+import json
+import os
+import sys
+from collections.abc import Mapping
+from os import path
+
+import numpy as np
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifacts import read_samples
+
+# A columnar store for the aggregated cohort, an alternative to reading all_samples.json or all_samples.csv
+# when only some of the columns are needed.
+#
+# The samples are split into a subjects table (identifier, dataset, diagnoses, ... one row per sample, in order)
+# and a table per instrument (one row per sample that has it, along with the row of its subject). Each column is
+# stored as its own array in an uncompressed .npz file, and arrays are only read when they're asked for:
+# - columns holding only ints (and None) are int8/16/32/64 arrays, whichever is smallest, with a mask of Nones
+# - anything else is dictionary encoded, an int32 code per row (-1 for None) into a list of distinct values
+# - if some rows don't have the key at all there's a mask of the rows that do
+# The tables, their columns and the dictionaries are listed in a json manifest stored alongside the arrays.
+
+# The code can be run with:
+# python3 cohort_store.py ../data/all_samples.json ../data/all_samples_cohort.npz
+
+STORE_VERSION = 1
+
+int_types = [np.int8, np.int16, np.int32, np.int64]
+
+# Marks a key a row doesn't have
+ABSENT = object()
+
+# Columns of a table, filled in a row at a time
+class TableBuilder:
+	def __init__(self):
+		self.num_rows = 0
+		self.columns = {}
+		self.subjects = []
+
+	def add_row(self, values, subject=None):
+		for key, value in values.items():
+			column = self.columns.get(key)
+			if column is None:
+				column = self.columns[key] = [ABSENT] * self.num_rows
+			column.append(value)
+		self.num_rows += 1
+		for column in self.columns.values():
+			if len(column) < self.num_rows:
+				column.append(ABSENT)
+		self.subjects.append(subject)
+
+# Encode a column, returns its manifest entry and arrays (by suffix)
+def encode_column(name, values):
+	entry = {'name': name}
+	arrays = {}
+
+	present = np.array([value is not ABSENT for value in values], dtype=bool)
+	if not present.all():
+		arrays['present'] = present
+	values = [None if value is ABSENT else value for value in values]
+
+	non_null = [value for value in values if value is not None]
+	if all(type(value) is int for value in non_null):
+		low, high = (min(non_null), max(non_null)) if len(non_null) > 0 else (0, 0)
+		dtype = next((t for t in int_types if np.iinfo(t).min <= low and high <= np.iinfo(t).max), None)
+		if dtype is not None:
+			entry['type'] = np.dtype(dtype).name
+			arrays['values'] = np.array([0 if value is None else value for value in values], dtype=dtype)
+			if len(non_null) < len(values):
+				arrays['nulls'] = np.array([value is None for value in values], dtype=bool)
+			return entry, arrays
+
+	# Values are compared by their json encoding, so 1, 1.0 and True get different codes
+	codes = {}
+	dictionary = []
+	column_codes = np.empty(len(values), dtype=np.int32)
+	for i, value in enumerate(values):
+		if value is None:
+			column_codes[i] = -1
+			continue
+		key = json.dumps(value, sort_keys=True)
+		if key not in codes:
+			codes[key] = len(dictionary)
+			dictionary.append(value)
+		column_codes[i] = codes[key]
+	entry['type'] = 'dictionary'
+	entry['dictionary'] = dictionary
+	arrays['values'] = column_codes
+	return entry, arrays
+
+# Write samples (any iterable) to a store at filename, returns the number of samples written
+def write_cohort(filename, samples):
+	subjects = TableBuilder()
+	instruments = {}
+	for i, sample in enumerate(samples):
+		fields = {}
+		for key, value in sample.items():
+			if isinstance(value, Mapping):
+				if key not in instruments:
+					instruments[key] = TableBuilder()
+				instruments[key].add_row(value, subject=i)
+			else:
+				fields[key] = value
+		subjects.add_row(fields)
+
+	clashes = set(instruments) & set(subjects.columns)
+	if len(clashes) > 0:
+		raise ValueError('%s are instruments in some samples and plain fields in others' % sorted(clashes))
+
+	manifest = {'version': STORE_VERSION, 'num_subjects': subjects.num_rows, 'tables': []}
+	arrays = {}
+	for t, (name, table) in enumerate([('subjects', subjects)] + list(instruments.items())):
+		table_entry = {'name': name, 'rows': table.num_rows, 'columns': []}
+		if name != 'subjects':
+			arrays['t%d_subject' % t] = np.array(table.subjects, dtype=np.int32)
+		for c, (column_name, values) in enumerate(table.columns.items()):
+			entry, column_arrays = encode_column(column_name, values)
+			entry['key'] = 't%dc%d' % (t, c)
+			for suffix, array in column_arrays.items():
+				arrays['%s_%s' % (entry['key'], suffix)] = array
+			table_entry['columns'].append(entry)
+		manifest['tables'].append(table_entry)
+	arrays['manifest'] = np.array(json.dumps(manifest))
+
+	tmp_path = '%s.%d.tmp' % (filename, os.getpid())
+	with open(tmp_path, 'wb') as f:
+		np.savez(f, **arrays)
+	os.replace(tmp_path, filename)
+	return subjects.num_rows
+
+class CohortStore:
+	def __init__(self, filename):
+		self.npz = np.load(filename)
+		self.files = set(self.npz.files)
+		manifest = json.loads(str(self.npz['manifest'][()]))
+		if manifest['version'] != STORE_VERSION:
+			raise ValueError('%s is a version %d cohort store, expected version %d' % (filename, manifest['version'], STORE_VERSION))
+		self.num_subjects = manifest['num_subjects']
+		self.table_entries = {}
+		self.table_keys = {}
+		for t, table in enumerate(manifest['tables']):
+			self.table_entries[table['name']] = dict(table, columns={column['name']: column for column in table['columns']},
+				column_order=[column['name'] for column in table['columns']])
+			self.table_keys[table['name']] = 't%d' % t
+
+	def close(self):
+		self.npz.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+	# Instruments in the store, in the order they were first seen
+	def instruments(self):
+		return [name for name in self.table_entries if name != 'subjects']
+
+	def columns(self, table):
+		return list(self.table_entries[table]['column_order']) if table in self.table_entries else []
+
+	# The row of the subjects table each row of an instrument table belongs to
+	def subject_rows(self, table):
+		if table == 'subjects':
+			return np.arange(self.num_subjects)
+		return self.npz['%s_subject' % self.table_keys[table]]
+
+	def _array(self, entry, suffix):
+		key = '%s_%s' % (entry['key'], suffix)
+		return self.npz[key] if key in self.files else None
+
+	# The values of a column as python values, one per row of table, with None where a row has no value.
+	# If with_present is set, also returns a mask of the rows that have the key (None if they all do).
+	def column(self, table, name, with_present=False):
+		entry = self.table_entries[table]['columns'][name]
+		values = self._array(entry, 'values')
+		if entry['type'] == 'dictionary':
+			dictionary = entry['dictionary']
+			result = [None if code < 0 else dictionary[code] for code in values.tolist()]
+		else:
+			result = values.tolist()
+			nulls = self._array(entry, 'nulls')
+			if nulls is not None:
+				for i in np.flatnonzero(nulls).tolist():
+					result[i] = None
+
+		present = self._array(entry, 'present')
+		if present is not None:
+			for i in np.flatnonzero(~present).tolist():
+				result[i] = None
+		return (result, present) if with_present else result
+
+	# An int column spread over every subject, with fill wherever a subject has no value
+	# (doesn't have the instrument, doesn't have the key or has None)
+	def int_column(self, table, name, fill=-1, dtype=int):
+		result = np.full(self.num_subjects, fill, dtype=dtype)
+		entry = self.table_entries[table]['columns'][name]
+		if entry['type'] == 'dictionary':
+			values = np.array([fill if value is None else value for value in self.column(table, name)], dtype=dtype)
+			result[self.subject_rows(table)] = values
+			return result
+
+		has_value = np.ones(self.table_entries[table]['rows'], dtype=bool)
+		for mask, keep in [(self._array(entry, 'nulls'), False), (self._array(entry, 'present'), True)]:
+			if mask is not None:
+				has_value &= mask if keep else ~mask
+		result[self.subject_rows(table)[has_value]] = self._array(entry, 'values')[has_value]
+		return result
+
+	# Rebuild the samples, in order
+	def samples(self):
+		samples = [dict() for _ in range(self.num_subjects)]
+		for table in self.table_entries:
+			rows = [samples[i] for i in self.subject_rows(table).tolist()] if table != 'subjects' else samples
+			if table != 'subjects':
+				instrument_rows = [dict() for _ in rows]
+				for sample, values in zip(rows, instrument_rows):
+					sample[table] = values
+				rows = instrument_rows
+			for name in self.table_entries[table]['column_order']:
+				values, present = self.column(table, name, with_present=True)
+				if present is None:
+					for row, value in zip(rows, values):
+						row[name] = value
+				else:
+					for row, value, has_key in zip(rows, values, present.tolist()):
+						if has_key:
+							row[name] = value
+		return samples
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Write samples to a columnar cohort store')
+	parser.add_argument('input_file')
+	parser.add_argument('output_file')
+	args = parser.parse_args()
+
+	print(write_cohort(args.output_file, read_samples(args.input_file)))
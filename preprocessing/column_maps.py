@@ -0,0 +1,87 @@
+import json
+import os
+
+# The column maps used to pull instrument items out of raw phenotype files live in mappings/*.json.
+# Each file describes the raw files of one dataset:
+#
+# "sources": {source file: {instrument: spec}} - the column map for each raw file and the instrument it holds.
+#     NDAR files live in one directory per collection, so they're listed by file name only.
+# "maps": {name: spec} - maps shared between several sources
+# "relabels": {name: {item: item or null}} - renames items, used to convert short versions of an instrument to the long version
+#
+# A spec builds a map from item to column (an int, a pair of columns where the second one is used if the first
+# is missing, or null if the file doesn't have the item) out of these keys, applied in this order:
+# "columns": {item: column} - columns listed out
+# "sequence": {"prefix", "digits", "first", "last", "first_column"} - items prefix+first..prefix+last (zero padded to digits)
+#     in consecutive columns starting at first_column
+# "map": name - start from a shared map
+# "shift": [[bound, offset], ...] - add offset to every column <= bound, using the first bound that applies (null matches everything)
+# "relabel": name - rename items with a relabel table, items mapped to null are left without a column
+#
+# Everything is compiled into plain {item: column} dicts once, when the maps are loaded.
+
+class ColumnMaps:
+	def __init__(self, directory):
+		self.maps = {}
+		self.relabels = {}
+		specs = {}
+
+		for filename in sorted(os.listdir(directory)):
+			if not filename.endswith('.json'):
+				continue
+			with open(os.path.join(directory, filename)) as f:
+				registry = json.load(f)
+			for table, entries in [(self.maps, registry.get('maps', {})), (self.relabels, registry.get('relabels', {}))]:
+				for name, value in entries.items():
+					if name in table:
+						raise ValueError('%s: %s is defined more than once' % (filename, name))
+					table[name] = value
+			for source, instruments in registry.get('sources', {}).items():
+				for instrument, spec in instruments.items():
+					if (source, instrument) in specs:
+						raise ValueError('%s: %s %s is defined more than once' % (filename, source, instrument))
+					specs[(source, instrument)] = spec
+
+		self.plans = {key: self.compile(spec) for key, spec in specs.items()}
+
+	def compile(self, spec):
+		cols = {}
+		if 'map' in spec:
+			cols.update(self.compile(self.maps[spec['map']]))
+		if 'sequence' in spec:
+			seq = spec['sequence']
+			for i in range(seq['first'], seq['last'] + 1):
+				cols['%s%s' % (seq['prefix'], str(i).zfill(seq['digits']))] = seq['first_column'] + i - seq['first']
+		for q_num, col in spec.get('columns', {}).items():
+			cols[q_num] = tuple(col) if isinstance(col, list) else col
+
+		if 'shift' in spec:
+			cols = {q_num: _shift(col, spec['shift']) for q_num, col in cols.items()}
+		if 'relabel' in spec:
+			cols = {q_num: None if short is None else cols[short] for q_num, short in self.relabels[spec['relabel']].items()}
+		return cols
+
+	def __getitem__(self, key):
+		return self.plans[key]
+
+	def __contains__(self, key):
+		return key in self.plans
+
+	# Make sure every item in every map is an item of its instrument
+	def validate(self, instrument_to_codes):
+		for (source, instrument), cols in self.plans.items():
+			if instrument not in instrument_to_codes:
+				raise ValueError('%s: unknown instrument %s' % (source, instrument))
+			unknown = [q_num for q_num in cols if q_num not in instrument_to_codes[instrument]]
+			if len(unknown) > 0:
+				raise ValueError('%s: %s has no items %s' % (source, instrument, ', '.join(unknown)))
+
+def _shift(col, shifts):
+	if col is None:
+		return None
+	if isinstance(col, tuple):
+		return tuple(_shift(c, shifts) for c in col)
+	for bound, offset in shifts:
+		if bound is None or col <= bound:
+			return col + offset
+	return col
@@ -0,0 +1,151 @@
+from collections import Counter
+
+from preprocessing.raw_files import read_rows, select_columns
+
+# A column-at-a-time version of the row parser in aggregate_phenotype.py.
+# Raw instrument files are wide (100+ ADIR items) and long, but each item column only takes a handful of
+# distinct values. Instead of running the missing data check, value transform, exception remap, rounding and
+# coded/ordinal split for every cell, the columns in the map are pulled out of the file once, each distinct
+# value in a column is decoded once, and the results are mapped back over the whole column.
+
+# Stands in for the columns a row is too short to have
+NO_COLUMN = object()
+
+# Warnings for rows that can't be read, see parse_phenotypes
+MISSING_COLUMN_WARNING = 'Row is missing a column'
+
+def unread_answer_warning(answer):
+	return 'Could not read answer %r' % (answer,)
+
+# Decode a single raw answer into its (ordinal, coded) pair, see convert_phenotypes.
+# Also returns the (answer, replacement) of the exception that was applied, if any.
+def decode_answer(q_num, answer, value_transform, exceptions, coded_values, missing_data):
+	# Trasnform answer
+	if value_transform is not None and answer not in missing_data:
+		answer = value_transform(q_num, answer)
+
+	# Transform answer in the case of an exception
+	remapped = None
+	if q_num in exceptions:
+		q_except = exceptions[q_num]
+		if answer in q_except:
+			remapped = (answer, q_except[answer])
+			answer = q_except[answer]
+
+	if answer in missing_data:
+		return None, None, remapped
+
+	answer = int(round(float(answer), 0))
+	if coded_values is not None:
+		return (answer if answer not in coded_values else None), (answer if answer in coded_values else 0), remapped
+	return answer, None, remapped
+
+# Parse a raw phenotype file, returns the same (identifier, info, values) rows and events as parse_phenotypes.
+def parse_columns(path, lambdas, cols, num_headers, delimiter, value_transform, exceptions, codes, missing_data):
+	# Rows after the header
+	all_pieces = read_rows(path, delimiter, encoding='utf-8', errors='ignore')[num_headers:]
+
+	# Lambdas are arbitrary python, so sample information is still pulled row by row
+	identifiers = []
+	infos = []
+	for pieces in all_pieces:
+		identifiers.append(lambdas["identifier"](pieces))
+
+		info = dict()
+		for key, value in lambdas.items():
+			v = value(pieces)
+			if v is not None and value != '':
+				info[key] = v
+		infos.append(info)
+
+	# Only the columns in the map are pulled out
+	needed = set()
+	for col in cols.values():
+		if isinstance(col, tuple):
+			needed.update(col[:2])
+		elif col is not None:
+			needed.add(col)
+	width = max(needed) + 1 if len(needed) > 0 else 0
+	columns = select_columns([pieces if len(pieces) >= width else list(pieces) + [NO_COLUMN] * (width - len(pieces)) for pieces in all_pieces], needed)
+
+	# Exceptions applied, answers discarded as missing and problems with the map, see parse_phenotypes
+	events = {'remaps': Counter(), 'missing': Counter(), 'warnings': Counter()}
+
+	# The first item of each row that couldn't be read, with its warning
+	unread = {}
+	# How each column's answers were decoded, to take the events of unread rows back out
+	decoded = []
+
+	keys = []
+	value_columns = []
+	for q_num, col in cols.items():
+		coded_values = codes[q_num]
+
+		if col is None:
+			# Nothing to read, every row gets the same answer
+			answers = (None,) * len(all_pieces)
+		elif isinstance(col, tuple):
+			# If answer is split into multiple columns, take the second one wherever the first is missing
+			if len(col) != 2:
+				events['warnings'][(q_num, 'Tuple longer than expected: %s' % (col,))] += len(all_pieces)
+			answers = [second if first in missing_data else first
+				for first, second in zip(columns[col[0]], columns[col[1]])]
+		else:
+			answers = columns[col]
+
+		# Decode each distinct answer once, then map the results over the column
+		ord_values = dict()
+		cod_values = dict()
+		answer_events = dict()
+		failed = dict()
+		for answer, n in Counter(answers).items():
+			try:
+				if answer is NO_COLUMN:
+					raise IndexError(q_num)
+				ord_values[answer], cod_values[answer], remapped = decode_answer(q_num, answer, value_transform, exceptions, coded_values, missing_data)
+			except IndexError:
+				failed[answer] = MISSING_COLUMN_WARNING
+			except ValueError:
+				failed[answer] = unread_answer_warning(answer)
+			else:
+				answer_events[answer] = []
+				if remapped is not None:
+					answer_events[answer].append(('remaps', (q_num,) + remapped))
+				if col is not None and ord_values[answer] is None and cod_values[answer] is None:
+					answer_events[answer].append(('missing', (q_num,)))
+				for section, key in answer_events[answer]:
+					events[section][key] += n
+
+		# Rows with an answer that couldn't be read get None for it, the row is dropped below
+		if len(failed) > 0:
+			for i, answer in enumerate(answers):
+				if answer in failed and i not in unread:
+					unread[i] = (q_num, failed[answer])
+			for answer in failed:
+				ord_values[answer] = cod_values[answer] = None
+		decoded.append((answers, answer_events, q_num if isinstance(col, tuple) and len(col) != 2 else None))
+
+		keys.append(q_num)
+		value_columns.append(list(map(ord_values.__getitem__, answers)))
+		if coded_values is not None:
+			keys.append("%sa" % q_num)
+			value_columns.append(list(map(cod_values.__getitem__, answers)))
+
+	if len(value_columns) > 0:
+		values = [dict(zip(keys, row_values)) for row_values in zip(*value_columns)]
+	else:
+		values = [dict() for _ in all_pieces]
+
+	# Unread rows only count the warning of the item that failed, like they do in parse_phenotypes
+	for i, warning in unread.items():
+		values[i] = None
+		events['warnings'][warning] += 1
+		for answers, answer_events, long_tuple in decoded:
+			for section, key in answer_events.get(answers[i], []):
+				events[section][key] -= 1
+			if long_tuple is not None:
+				events['warnings'][(long_tuple, 'Tuple longer than expected: %s' % (cols[long_tuple],))] -= 1
+	if len(unread) > 0:
+		events = {section: +counts for section, counts in events.items()}
+
+	return list(zip(identifiers, infos, values)), events
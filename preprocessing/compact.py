@@ -0,0 +1,147 @@
+from array import array
+from collections.abc import MutableMapping
+
+from preprocessing.schema_service import schema_service
+
+# A compact stand-in for the instrument dicts in a sample.
+# An instrument dict has an entry for every item, coded value and score of its schema (close to 400 for
+# ADIR1995), each with its own hash table slot and boxed value, which adds up to gigabytes once every cohort
+# is loaded. Almost all of the values are small ints or None, so CompactInstrument keeps them in a typed array
+# laid out by the instrument's schema, with a byte per key saying whether it's missing, None or an int.
+# Anything else (interview_date, diagnoses, keys that aren't in the schema) goes in a small dict on the side.
+#
+# CompactInstrument behaves like the dict it replaces, so sample[instrument][key] reads and writes work as
+# before. Instruments are told apart from the other fields of a sample with isinstance(value, Mapping),
+# json.dumps needs default=dict to write them and expand_sample turns them back into plain dicts.
+
+MISSING, NONE, INT = 0, 1, 2
+
+# int16, which holds every answer, code and score
+INT_MIN, INT_MAX = -(1 << 15), (1 << 15) - 1
+
+# The keys of an instrument's schema, in schema order
+class InstrumentLayout:
+	def __init__(self, instrument, keys):
+		self.instrument = instrument
+		self.keys = tuple(keys)
+		self.index = {key: i for i, key in enumerate(self.keys)}
+
+layouts = {}
+
+def instrument_layout(instrument):
+	if instrument not in layouts:
+		layouts[instrument] = InstrumentLayout(instrument, schema_service.document(instrument)['properties'])
+	return layouts[instrument]
+
+class CompactInstrument(MutableMapping):
+	__slots__ = ('layout', 'ints', 'state', 'extra')
+
+	def __init__(self, layout, items=()):
+		self.layout = layout
+		self.ints = array('h', bytes(2 * len(layout.keys)))
+		self.state = bytearray(len(layout.keys))
+		self.extra = None
+		self.update(items)
+
+	def __getitem__(self, key):
+		i = self.layout.index.get(key)
+		if i is not None:
+			state = self.state[i]
+			if state == INT:
+				return self.ints[i]
+			if state == NONE:
+				return None
+		if self.extra is not None and key in self.extra:
+			return self.extra[key]
+		raise KeyError(key)
+
+	def __setitem__(self, key, value):
+		i = self.layout.index.get(key)
+		if i is not None and (value is None or (type(value) is int and INT_MIN <= value <= INT_MAX)):
+			if value is None:
+				self.state[i] = NONE
+			else:
+				self.ints[i] = value
+				self.state[i] = INT
+			if self.extra is not None:
+				self.extra.pop(key, None)
+			return
+
+		if i is not None:
+			self.state[i] = MISSING
+		if self.extra is None:
+			self.extra = {}
+		self.extra[key] = value
+
+	def __delitem__(self, key):
+		i = self.layout.index.get(key)
+		if i is not None and self.state[i] != MISSING:
+			self.state[i] = MISSING
+		elif self.extra is not None and key in self.extra:
+			del self.extra[key]
+		else:
+			raise KeyError(key)
+
+	def __contains__(self, key):
+		i = self.layout.index.get(key)
+		if i is not None and self.state[i] != MISSING:
+			return True
+		return self.extra is not None and key in self.extra
+
+	def __iter__(self):
+		for key, state in zip(self.layout.keys, self.state):
+			if state != MISSING:
+				yield key
+		if self.extra is not None:
+			yield from self.extra
+
+	def __len__(self):
+		return len(self.state) - self.state.count(MISSING) + (0 if self.extra is None else len(self.extra))
+
+	def items(self):
+		return list(self._items())
+
+	def _items(self):
+		for key, state, value in zip(self.layout.keys, self.state, self.ints):
+			if state == INT:
+				yield key, value
+			elif state == NONE:
+				yield key, None
+		if self.extra is not None:
+			yield from self.extra.items()
+
+	def copy(self):
+		return dict(self._items())
+
+	def __repr__(self):
+		return 'CompactInstrument(%r, %r)' % (self.layout.instrument, dict(self._items()))
+
+	# Workers hand samples back to the parent process, only the instrument name is needed to find the layout again
+	def __reduce__(self):
+		return (_restore, (self.layout.instrument, self.ints.tobytes(), bytes(self.state), self.extra))
+
+def _restore(instrument, ints, state, extra):
+	compact = CompactInstrument.__new__(CompactInstrument)
+	compact.layout = instrument_layout(instrument)
+	compact.ints = array('h')
+	compact.ints.frombytes(ints)
+	compact.state = bytearray(state)
+	compact.extra = extra
+	return compact
+
+# The compact form of an instrument dict, instruments without a schema are left as they are
+def compact_instrument(instrument, values):
+	if instrument not in schema_service.object_instruments():
+		return values
+	return CompactInstrument(instrument_layout(instrument), values.items())
+
+# Replace every instrument dict in sample with its compact form
+def compact_sample(sample):
+	for key, value in sample.items():
+		if type(value) is dict:
+			sample[key] = compact_instrument(key, value)
+	return sample
+
+# A copy of sample with plain dicts for instruments
+def expand_sample(sample):
+	return {key: dict(value) if isinstance(value, CompactInstrument) else value for key, value in sample.items()}
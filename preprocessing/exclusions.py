@@ -0,0 +1,74 @@
+import csv
+import time
+from collections import Counter
+
+# Samples we leave out of the aggregated data, keyed by (dataset, identifier).
+# Samples from different datasets are merged by identifier alone, so an exclusion drops the identifier's rows
+# from every raw file, not just the ones from its own dataset. Lookups go through an identifier -> key dict
+# so checking a row is O(1).
+#
+# Exclusions are read from tab separated files with one dataset and identifier per line,
+# blank lines and lines starting with # are ignored.
+
+class ExclusionIndex:
+	def __init__(self, keys=()):
+		self.identifier_to_key = {}
+		self.identifiers = frozenset()
+		self.dropped_rows = Counter()
+		self.removed = set()
+		self.load_time = 0.0
+		self.remove_time = 0.0
+		for dataset, identifier in keys:
+			self.add(dataset, identifier)
+
+	def add(self, dataset, identifier):
+		self.identifier_to_key[identifier] = (dataset, identifier)
+		self.identifiers = frozenset(self.identifier_to_key)
+
+	def load(self, filename):
+		start = time.time()
+		with open(filename) as f:
+			for pieces in csv.reader(f, delimiter='\t'):
+				if len(pieces) == 0 or pieces[0].strip() == '' or pieces[0].startswith('#'):
+					continue
+				if len(pieces) != 2:
+					raise ValueError('%s: expected dataset and identifier, got %s' % (filename, pieces))
+				self.add(pieces[0].strip(), pieces[1].strip())
+		self.load_time += time.time() - start
+
+	def __contains__(self, identifier):
+		return identifier in self.identifier_to_key
+
+	def __len__(self):
+		return len(self.identifier_to_key)
+
+	# (dataset, identifier) of every exclusion
+	def keys(self):
+		return list(self.identifier_to_key.values())
+
+	# Count a raw row that was skipped because of its identifier
+	def record_dropped_row(self, identifier):
+		self.dropped_rows[self.identifier_to_key[identifier]] += 1
+
+	# Row counts are kept per process, take them out so they can be merged by the parent process
+	def take_dropped_rows(self):
+		dropped_rows, self.dropped_rows = self.dropped_rows, Counter()
+		return dropped_rows
+
+	def add_dropped_rows(self, dropped_rows):
+		self.dropped_rows.update(dropped_rows)
+
+	# Remove excluded samples from identifier_to_samples
+	def remove_samples(self, identifier_to_samples):
+		start = time.time()
+		for identifier, key in self.identifier_to_key.items():
+			if identifier in identifier_to_samples:
+				del identifier_to_samples[identifier]
+				self.removed.add(key)
+		self.remove_time += time.time() - start
+
+	def print_summary(self):
+		print('Excluded %d samples (loaded in %.3fs, removed in %.3fs)' % (len(self.removed), self.load_time, self.remove_time))
+		for key in sorted(self.identifier_to_key.values()):
+			print('\t%s\t%s\t%d rows dropped%s' % (key[0], key[1], self.dropped_rows[key],
+				', sample removed' if key in self.removed else ''))
@@ -1,7 +1,14 @@
+import argparse
 import csv
-import json
 import sys
 import numpy as np
+from itertools import islice
+from os import path
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifacts import read_samples
+from preprocessing.cohort_store import CohortStore
+from preprocessing.schema_service import schema_service
 
 # This script column filters all_samples.csv
 # We are discarding the following features for analysis:
@@ -13,41 +20,41 @@ import numpy as np
 # It is meant to be run as part of a multi-stage pipeline described in the README.
 
 # The code can be run with:
-# python3 filter_ordinal_features.py
+# python3 filter_ordinal_features.py ../data/all_samples [--cohort]
+# With --cohort the labels and ordinal features are read from all_samples_cohort.npz (see cohort_store.py)
+# instead of all_samples.csv and all_samples.json, and only those columns are loaded.
+# With --npy only all_samples.json is read, once, and the ordinal features are written as an int8 or int16
+# matrix to all_samples_ordinal.npy (with the feature names in all_samples_ordinal_header.txt, one per line)
+# instead of all_samples_ordinal.csv. The features are the ones the schemas mark as ordinal, so all_samples.csv
+# isn't needed at all.
 
-filename = sys.argv[1]
+ordinal_features = schema_service.ordinal_features()
+instruments = schema_service.object_instruments()
 
-with open("schemas/Individual.json") as schema_file:    
-	pheno_schema = json.load(schema_file)
+# Samples read into the ordinal matrix together
+BLOCK_SIZE = 4096
 
-ordinal_features = set()
-instruments = [k for k, v in pheno_schema['properties'].items() if 'type' in v and v['type'] == 'object']
-for instrument in instruments:
-	with open('schemas/%s.json' % instrument) as instrument_schema_file:
-		instrument_schema = json.load(instrument_schema_file)
-		for feature in instrument_schema['properties'].keys():
-			if 'data-type' in instrument_schema['properties'][feature] and instrument_schema['properties'][feature]['data-type'] == 'ordinal':
-				ordinal_features.add('%s:%s' % (instrument, feature))
+int_types = [np.int8, np.int16]
 
-with open('%s.json' % filename, 'r') as f:
-    # Read in samples
-    samples = json.load(f)
+# Columns in the order json-to-csv.py puts them in
+def csv_order(header):
+	return sorted(header, key=lambda h: (h.count(':'), h.lower(), h))
 
-with open("%s.csv" % filename) as f:
-	reader = csv.reader(f)
-	header = next(reader)
+label_cols = ['identifier', 'clinical_diagnosis', 'gender', 'dataset', 'age', 'race', 'ethnicity', 
+		'family', 'mother_id', 'father_id',
+		'ADIR2003:diagnosis', 'ADIR2003:diagnosis_num_nulls',
+		'ADOS_Module1:diagnosis', 'ADOS_Module1:diagnosis_num_nulls', 
+		'ADOS_Module2:diagnosis', 'ADOS_Module2:diagnosis_num_nulls', 
+		'ADOS_Module3:diagnosis', 'ADOS_Module3:diagnosis_num_nulls', 
+		'ADOS_Module4:diagnosis', 'ADOS_Module4:diagnosis_num_nulls', 
+		'SRS_Child:diagnosis', 'SRS_Child:diagnosis_num_nulls']
 
+# rows are the csv rows of samples, in the same order. Labels are written to label_file and the ordinal
+# features are written to ordinal_file (if given) and returned as (header, rows)
+def filter_ordinal_features(header, rows, samples, label_file, ordinal_file=None):
 	# pull labels for label file
-	label_cols = ['identifier', 'clinical_diagnosis', 'gender', 'dataset', 'age', 'race', 'ethnicity', 
-			'family', 'mother_id', 'father_id',
-			'ADIR2003:diagnosis', 'ADIR2003:diagnosis_num_nulls',
-			'ADOS_Module1:diagnosis', 'ADOS_Module1:diagnosis_num_nulls', 
-			'ADOS_Module2:diagnosis', 'ADOS_Module2:diagnosis_num_nulls', 
-			'ADOS_Module3:diagnosis', 'ADOS_Module3:diagnosis_num_nulls', 
-			'ADOS_Module4:diagnosis', 'ADOS_Module4:diagnosis_num_nulls', 
-			'SRS_Child:diagnosis', 'SRS_Child:diagnosis_num_nulls']
-	label_cols = [x for x in label_cols if x in header]
-	label_indices = [header.index(x) for x in label_cols]
+	labels = [x for x in label_cols if x in header]
+	label_indices = [header.index(x) for x in labels]
 
 	# Pull ordinal features that belong to the instruments we're interested in
 	keep_cols = []
@@ -56,19 +63,171 @@ with open("%s.csv" % filename) as f:
 			keep_cols.append(i)
 	print('Keeping %d features' % (len(keep_cols)))
 
-	with open(filename + '_ordinal_labels.csv', 'w+') as label_outfile, open(filename + '_ordinal.csv', 'w+') as outfile:
+	ordinal_header = [header[i] for i in keep_cols]
+	ordinal_rows = []
+	with open(label_file, 'w+') as label_outfile:
 		label_writer = csv.writer(label_outfile)
-		writer = csv.writer(outfile)
 
-		label_writer.writerow(label_cols + ['has_' + inst for inst in instruments])
-		writer.writerow([header[i] for i in keep_cols])
-		num_rows_written = 0
-		for row, sample in zip(reader, samples):
+		label_writer.writerow(labels + ['has_' + inst for inst in instruments])
+		for row, sample in zip(rows, samples):
 			data = [("-1" if row[i] == '' or row[i] == 'None' else row[i]) for i in keep_cols]
 			if len([d for d in data if d != 'None']) > 1:
 				label_writer.writerow([("-1" if row[i] == '' or row[i] == 'None' else row[i]) for i in label_indices] + [1 if inst in sample else 0 for inst in instruments])
-				writer.writerow(data)
-				num_rows_written += 1
-	print('Keeping %d rows' % num_rows_written)
+				ordinal_rows.append(data)
+	print('Keeping %d rows' % len(ordinal_rows))
+
+	if ordinal_file is not None:
+		with open(ordinal_file, 'w+') as outfile:
+			writer = csv.writer(outfile)
+			writer.writerow(ordinal_header)
+			writer.writerows(ordinal_rows)
+	return ordinal_header, ordinal_rows
+
+# Same as filter_ordinal_features, but reads the columns it needs from a cohort store
+def filter_ordinal_features_cohort(store, label_file, ordinal_file=None):
+	# The store's columns as they're named in the csv, in the same order
+	header = list(store.columns('subjects'))
+	for instrument in store.instruments():
+		header.extend('%s:%s' % (instrument, name) for name in store.columns(instrument))
+	header = csv_order(header)
+
+	labels = [x for x in label_cols if x in header]
+	ordinal_header = [h for h in header if h in ordinal_features]
+	print('Keeping %d features' % (len(ordinal_header)))
+
+	# Values as they'd be read from the csv, where a missing value is blank or None
+	label_columns = []
+	for label in labels:
+		table, name = label.split(':') if ':' in label else ('subjects', label)
+		values = [None] * store.num_subjects
+		for i, value in zip(store.subject_rows(table).tolist(), store.column(table, name)):
+			values[i] = value
+		label_columns.append(["-1" if value is None or str(value) in ['', 'None'] else str(value) for value in values])
+	has_instrument = np.zeros((len(instruments), store.num_subjects), dtype=int)
+	for i, inst in enumerate(instruments):
+		if inst in store.instruments():
+			has_instrument[i, store.subject_rows(inst)] = 1
+
+	# Missing values are -1, so as in filter_ordinal_features every row is kept if there's more than one feature
+	ordinal_rows = []
+	if len(ordinal_header) > 1:
+		ordinal_rows = np.column_stack([store.int_column(*h.split(':'), fill=-1) for h in ordinal_header]).tolist()
+
+	with open(label_file, 'w+') as label_outfile:
+		label_writer = csv.writer(label_outfile)
+
+		label_writer.writerow(labels + ['has_' + inst for inst in instruments])
+		if len(ordinal_rows) > 0:
+			label_writer.writerows(zip(*label_columns, *has_instrument.tolist()))
+	print('Keeping %d rows' % len(ordinal_rows))
+
+	if ordinal_file is not None:
+		with open(ordinal_file, 'w+') as outfile:
+			writer = csv.writer(outfile)
+			writer.writerow(ordinal_header)
+			writer.writerows(ordinal_rows)
+	return ordinal_header, ordinal_rows
+
+# Same as filter_ordinal_features, but straight from the samples (any iterable, gone through once).
+# The ordinal features are returned as an int8 array, or int16 if something doesn't fit (answers are all int16,
+# as in compact.py), and saved with np.save to ordinal_file (if given), with the feature names written next to it.
+def export_ordinal_features(samples, label_file, ordinal_file=None):
+	# Every ordinal feature of the schemas, only the ones some sample has are kept (as they'd be csv columns)
+	features = csv_order(ordinal_features)
+	feature_column = {feature: j for j, feature in enumerate(features)}
+	instrument_keys, instrument_columns = {}, {}
+	for feature in features:
+		instrument, key = feature.split(':', 1)
+		instrument_keys.setdefault(instrument, []).append(key)
+		instrument_columns.setdefault(instrument, []).append(feature_column[feature])
+	instrument_columns = {instrument: np.array(columns) for instrument, columns in instrument_columns.items()}
+	instrument_key_sets = {instrument: set(keys) for instrument, keys in instrument_keys.items()}
+	seen = np.zeros(len(features), dtype=bool)
+	seen_keys = {instrument: set() for instrument in instrument_keys}
+
+	label_seen = set()
+	label_rows = []
+	blocks = []
+	samples = iter(samples)
+	while True:
+		block = list(islice(samples, BLOCK_SIZE))
+		if len(block) == 0:
+			break
+		values = np.full((len(block), len(features)), -1, dtype=np.int16)
+		for r, sample in enumerate(block):
+			for instrument, keys in instrument_keys.items():
+				if instrument in sample:
+					answers = sample[instrument]
+					values[r, instrument_columns[instrument]] = [-1 if value is None else value for value in map(answers.get, keys)]
+					if len(seen_keys[instrument]) < len(keys):
+						seen_keys[instrument].update(instrument_key_sets[instrument].intersection(answers.keys()))
+
+			# Labels as they'd be read from the csv, where a missing value is blank or None
+			label_row = []
+			for label in label_cols:
+				if ':' in label:
+					instrument, key = label.split(':', 1)
+					value = sample[instrument].get(key) if instrument in sample else None
+					if instrument in sample and key in sample[instrument]:
+						label_seen.add(label)
+				else:
+					value = sample.get(label)
+					if label in sample:
+						label_seen.add(label)
+				label_row.append("-1" if value is None or str(value) in ['', 'None'] else str(value))
+			label_rows.append(label_row + [1 if inst in sample else 0 for inst in instruments])
+		blocks.append(values)
+
+	for instrument, keys in seen_keys.items():
+		for key in keys:
+			seen[feature_column['%s:%s' % (instrument, key)]] = True
+	ordinal_header = [feature for feature, keep in zip(features, seen) if keep]
+	print('Keeping %d features' % (len(ordinal_header)))
+
+	values = np.concatenate(blocks)[:, seen] if len(blocks) > 0 else np.zeros((0, len(ordinal_header)), dtype=np.int16)
+	# As in filter_ordinal_features, every row is kept if there's more than one feature
+	if len(ordinal_header) <= 1:
+		values, label_rows = values[:0], []
+	low, high = (int(values.min()), int(values.max())) if values.size > 0 else (-1, -1)
+	values = values.astype(next(t for t in int_types if np.iinfo(t).min <= low and high <= np.iinfo(t).max))
+
+	labels = [x for x in label_cols if x in label_seen]
+	label_indices = [label_cols.index(x) for x in labels] + list(range(len(label_cols), len(label_cols) + len(instruments)))
+	with open(label_file, 'w+') as label_outfile:
+		label_writer = csv.writer(label_outfile)
+
+		label_writer.writerow(labels + ['has_' + inst for inst in instruments])
+		label_writer.writerows([row[i] for i in label_indices] for row in label_rows)
+	print('Keeping %d rows' % len(values))
+
+	if ordinal_file is not None:
+		np.save(ordinal_file, values)
+		with open(ordinal_file[:-4] + '_header.txt', 'w+') as outfile:
+			outfile.write(''.join('%s\n' % feature for feature in ordinal_header))
+	return ordinal_header, values
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Pull the ordinal features and labels out of the aggregated samples')
+	parser.add_argument('filename', help='all_samples.csv and all_samples.json are read from filename.csv and filename.json')
+	parser.add_argument('--cohort', action='store_true', help='read from filename_cohort.npz instead')
+	parser.add_argument('--npy', action='store_true', help='read only filename.json and write the ordinal features to filename_ordinal.npy')
+	args = parser.parse_args()
+	filename = args.filename
+
+	if args.npy:
+		export_ordinal_features(read_samples('%s.json' % filename), filename + '_ordinal_labels.csv', filename + '_ordinal.npy')
+		sys.exit()
+
+	if args.cohort:
+		with CohortStore('%s_cohort.npz' % filename) as store:
+			filter_ordinal_features_cohort(store, filename + '_ordinal_labels.csv', filename + '_ordinal.csv')
+		sys.exit()
+
+	# Read in samples, one at a time as we go through the csv
+	samples = read_samples('%s.json' % filename)
 
+	with open("%s.csv" % filename) as f:
+		reader = csv.reader(f)
+		header = next(reader)
+		filter_ordinal_features(header, reader, samples, filename + '_ordinal_labels.csv', filename + '_ordinal.csv')
 
@@ -0,0 +1,103 @@
+import csv
+
+# Which identifiers belong to the same subject.
+# Samples are merged by identifier, but some subjects show up under more than one (NDAR pseudo-GUIDs that
+# were later replaced by GUIDs are listed in each collection's guid_parent_child.txt). Aliases are kept in a
+# union-find, so adding one and looking up the canonical id of an identifier are both close to O(1).
+# The canonical id of a subject is the identifier it was first given an alias under, and stays that way
+# as more aliases are added.
+#
+# Loaders can run in other processes, so the aliases each process adds are also kept in order to be
+# handed back to the parent process, like ExclusionIndex does with dropped rows.
+
+class IdentityIndex:
+	def __init__(self, aliases=()):
+		self.parent = {}
+		self.size = {}
+		self.canonical = {}
+		self.new_aliases = []
+		self.add_aliases(aliases)
+
+	def __contains__(self, identifier):
+		return identifier in self.parent
+
+	def _find(self, identifier):
+		if identifier not in self.parent:
+			self.parent[identifier] = identifier
+			self.size[identifier] = 1
+			self.canonical[identifier] = identifier
+			return identifier
+
+		root = identifier
+		while self.parent[root] != root:
+			root = self.parent[root]
+		# Point everything on the way straight at the root
+		while self.parent[identifier] != root:
+			self.parent[identifier], identifier = root, self.parent[identifier]
+		return root
+
+	# The identifier a subject's samples are merged under, identifiers without aliases are their own canonical id
+	def canonical_id(self, identifier):
+		if identifier not in self.parent:
+			return identifier
+		return self.canonical[self._find(identifier)]
+
+	# Record that alias is another identifier for the subject of identifier
+	def add_alias(self, identifier, alias):
+		self.new_aliases.append((identifier, alias))
+		root, alias_root = self._find(identifier), self._find(alias)
+		if root == alias_root:
+			return
+
+		canonical = self.canonical[root]
+		if self.size[root] < self.size[alias_root]:
+			root, alias_root = alias_root, root
+		self.parent[alias_root] = root
+		self.size[root] += self.size.pop(alias_root)
+		del self.canonical[alias_root]
+		self.canonical[root] = canonical
+
+	def add_aliases(self, aliases):
+		for identifier, alias in aliases:
+			self.add_alias(identifier, alias)
+
+	# Aliases are kept per process, take them out so they can be added to the index of the parent process
+	def take_aliases(self):
+		new_aliases, self.new_aliases = self.new_aliases, []
+		return new_aliases
+
+	# (alias, canonical id) for every identifier that isn't its subject's canonical id
+	def alias_table(self):
+		return sorted((identifier, self.canonical_id(identifier)) for identifier in self.parent
+			if self.canonical_id(identifier) != identifier)
+
+	def write_table(self, filename):
+		with open(filename, 'w+') as f:
+			writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+			writer.writerow(['alias', 'identifier'])
+			writer.writerows(self.alias_table())
+
+	def print_summary(self):
+		print('Resolved %d aliases to %d subjects' % (len(self.parent) - len(self.canonical), len(self.canonical)))
+
+# Sample information known about each subject (the known_data passed to convert_phenotypes), shared by all
+# of the subject's identifiers. Aliases need to be added through here so that the information already
+# known under both identifiers is combined, where they disagree identifier's information is kept.
+class SubjectInfo:
+	def __init__(self, identities):
+		self.identities = identities
+		self.info = {}
+
+	def __getitem__(self, identifier):
+		return self.info.setdefault(self.identities.canonical_id(identifier), {})
+
+	def update(self, identifier, info):
+		self[identifier].update(info)
+
+	def add_alias(self, identifier, alias):
+		canonical, alias_canonical = self.identities.canonical_id(identifier), self.identities.canonical_id(alias)
+		self.identities.add_alias(identifier, alias)
+		if canonical != alias_canonical:
+			info = self.info.pop(alias_canonical, {})
+			info.update(self.info.pop(canonical, {}))
+			self.info[canonical] = info
@@ -24,19 +24,12 @@
 ##
 
 import sys
-import json
 import csv
+from collections.abc import Mapping
+from os import path
 
-##
-# Convert to string keeping encoding in mind...
-##
-def to_string(s):
-    try:
-        return str(s)
-    except:
-        #Change the encoding type if needed
-        return s.encode('utf-8')
-
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifacts import read_samples
 
 ##
 # This function converts an item like 
@@ -50,38 +43,95 @@ def to_string(s):
 #       "sub_item_2":["sub_item_value_12", "sub_item_value_13"]
 #   }
 # }
-# To
-# {
-#   "node_item_1":"value_11",
-#   "node_item_2":"value_12",
-#   "node_item_3":"value_13",
-#   "node_item_4_0":"sub_value_14", 
-#   "node_item_4_1":"sub_value_15",
-#   "node_item_5_sub_item_1":"sub_item_value_11",
-#   "node_item_5_sub_item_2_0":"sub_item_value_12",
-#   "node_item_5_sub_item_2_0":"sub_item_value_13"
-# }
+# To the columns
+#   ["item_1", "item_2", "item_3", "item_4:0", "item_4:1", "item_5:sub_item_1", "item_5:sub_item_2:0", "item_5:sub_item_2:1"]
+# and their values (stringified when the row is written)
+#   ["value_11", "value_12", "value_13", "sub_value_14", "sub_value_15", "sub_item_value_11", "sub_item_value_12", "sub_item_value_13"]
+# walking the item depth first with a stack of the lists and dicts it's in the middle of, rather than recursing.
+# If two entries end up with the same column the last one wins.
 ##
 delimiter = ':'
-def reduce_item(key, value):
-    global reduced_item
-    
-    #Reduction Condition 1
-    if type(value) is list:
-        i=0
-        for sub_item in value:
-            reduce_item(('' if key is None else key+delimiter) +to_string(i), sub_item)
-            i=i+1
-
-    #Reduction Condition 2
-    elif type(value) is dict:
-        sub_keys = value.keys()
-        for sub_key in sub_keys:
-            reduce_item(('' if key is None else key+delimiter)+to_string(sub_key), value[sub_key])
-    
-    #Base Condition
-    else:
-        reduced_item[to_string(key)] = to_string(value)
+scalar_types = {str, int, float, bool, type(None)}
+def flatten_item(item):
+    columns, values = [], []
+    stack = [('', iter(item.items()))]
+    while len(stack) > 0:
+        prefix, entries = stack[-1]
+        for key, value in entries:
+            key = prefix + str(key)
+
+            #Base Condition
+            if type(value) in scalar_types:
+                columns.append(key)
+                values.append(value)
+
+            #Reduction Condition 1
+            elif type(value) is list:
+                stack.append((key + delimiter, iter(enumerate(value))))
+                break
+
+            #Reduction Condition 2 (dicts, and compact instruments)
+            elif isinstance(value, Mapping):
+                # Instruments only hold plain values, so they can be added all at once
+                if set(map(type, value.values())) <= scalar_types:
+                    columns.extend(map((key + delimiter).__add__, map(str, value.keys())))
+                    values.extend(value.values())
+                else:
+                    stack.append((key + delimiter, iter(value.items())))
+                    break
+
+            #Anything else json can't have
+            else:
+                columns.append(key)
+                values.append(value)
+        else:
+            stack.pop()
+    return columns, values
+
+
+##
+# The csv header, every column of every item sorted by depth and then name.
+# Only the columns are needed, so this is a quick pass over the items before they're written.
+##
+def csv_header(data_to_be_processed):
+    header = set()
+    for item in data_to_be_processed:
+        header.update(flatten_item(item)[0])
+
+    return sorted(header, key= lambda h: (h.count(delimiter), h.lower(), h))
+
+
+##
+# Lay each flattened item out in header order as it's read, missing items are left blank
+##
+def csv_rows(header, data_to_be_processed):
+    column_index = {h: i for i, h in enumerate(header)}
+    for item in data_to_be_processed:
+        row = [''] * len(header)
+        columns, values = flatten_item(item)
+        for i, value in zip(map(column_index.__getitem__, columns), map(str, values)):
+            row[i] = value
+        yield row
+
+
+##
+# The rows of a list of items, flattened again each time they're gone through (so they can be written
+# and then filtered without all of them being held at once)
+##
+class CsvRows:
+    def __init__(self, header, items):
+        self.header = header
+        self.items = items
+
+    def __iter__(self):
+        return csv_rows(self.header, self.items)
+
+
+def write_csv(csv_file_path, header, rows):
+    with open(csv_file_path, 'w+') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(header)
+        writer.writerows(rows)
 
 
 if __name__ == "__main__":
@@ -92,31 +142,9 @@ if __name__ == "__main__":
         json_file_path = sys.argv[1]
         csv_file_path = sys.argv[2]
 
-        fp = open(json_file_path, 'r')
-        json_value = fp.read()
-        raw_data = json.loads(json_value)
-
-        data_to_be_processed = raw_data
-
-        processed_data = []
-        header = []
-        for item in data_to_be_processed:
-            reduced_item = {}
-            reduce_item(None, item)
-
-            header += reduced_item.keys()
-
-            processed_data.append(reduced_item)
-
-        header = list(set(header))
-        header.sort(key= lambda h: (h.count(delimiter), h.lower()))
-
-        with open(csv_file_path, 'w+') as f:
-            writer = csv.DictWriter(f, header, quoting=csv.QUOTE_ALL)
-            writer.writeheader()
-            for row in processed_data:
-                writer.writerow(row)
+        # The file is read twice, once for the header and once to write the rows
+        header = csv_header(read_samples(json_file_path))
+        write_csv(csv_file_path, header, csv_rows(header, read_samples(json_file_path)))
 
         print("Just completed writing csv file with %d columns" % len(header))
 
-        
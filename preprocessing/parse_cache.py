@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import pickle
+import types
+
+# Parsing the raw phenotype files is the slowest part of stage 1, but most reruns only touch one or two files.
+# This module keeps the parsed rows of every raw file on disk so that unchanged files don't have to be re-parsed.
+#
+# An entry is keyed on the content hash of the raw file along with everything else that determines what the
+# parsed rows look like: the column map, the lambdas and value transform (their code as well as any data they
+# close over or read from module globals) and the version of the parser itself.
+# Hashing every raw file on each run would still mean reading all of the data, so the content hash of a file
+# is remembered along with its size and mtime and is only recomputed when one of those changes.
+
+# Build a canonical, hashable description of obj. Sets and dicts are sorted so the result doesn't depend on
+# string hash randomization, functions are described by their code, closure and the globals they reference.
+def _canonical(obj, seen):
+	if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+		return obj
+	if id(obj) in seen:
+		return ('<recursive>', seen[id(obj)][0])
+	# Keep obj alive so its id can't be reused by a temporary while we're still walking
+	seen[id(obj)] = (len(seen), obj)
+
+	if isinstance(obj, (list, tuple)):
+		return (type(obj).__name__, [_canonical(x, seen) for x in obj])
+	if isinstance(obj, (set, frozenset)):
+		return ('set', sorted((_canonical(x, seen) for x in obj), key=repr))
+	if isinstance(obj, dict):
+		return ('dict', sorted(([_canonical(k, seen), _canonical(v, seen)] for k, v in obj.items()), key=repr))
+	if isinstance(obj, types.CodeType):
+		return ('code', obj.co_code, [_canonical(c, seen) for c in obj.co_consts], obj.co_names)
+	if isinstance(obj, types.FunctionType):
+		closure = [_canonical(cell.cell_contents, seen) for cell in obj.__closure__ or []]
+		referenced = {name: obj.__globals__[name] for name in sorted(_global_names(obj.__code__)) if name in obj.__globals__}
+		return ('function', _canonical(obj.__code__, seen), _canonical(obj.__defaults__, seen), closure,
+			_canonical(referenced, seen))
+	if isinstance(obj, (type, types.ModuleType, types.BuiltinFunctionType)):
+		return ('name', getattr(obj, '__module__', None), getattr(obj, '__qualname__', obj.__name__))
+	return ('repr', repr(obj))
+
+# Global names used by a code object, including the ones used by nested functions and comprehensions
+def _global_names(code):
+	names = set(code.co_names)
+	for const in code.co_consts:
+		if isinstance(const, types.CodeType):
+			names |= _global_names(const)
+	return names
+
+def fingerprint(*objs):
+	return hashlib.sha1(repr(_canonical(objs, {})).encode('utf-8')).hexdigest()
+
+class ParseCache:
+	# version should change whenever the parser does, for example the fingerprint of the parsing function
+	def __init__(self, cache_dir, version):
+		self.cache_dir = cache_dir
+		self.version = version
+		os.makedirs(os.path.join(cache_dir, 'files'), exist_ok=True)
+		os.makedirs(os.path.join(cache_dir, 'entries'), exist_ok=True)
+
+	# Content hash of a raw file, reusing the stored hash if the file's size and mtime haven't changed
+	def file_hash(self, path):
+		path = os.path.abspath(path)
+		stat = os.stat(path)
+		record_path = self._record_path(path)
+
+		if os.path.exists(record_path):
+			with open(record_path) as record_file:
+				record = json.load(record_file)
+			if record['path'] == path and record['size'] == stat.st_size and record['mtime'] == stat.st_mtime_ns:
+				return record['sha1']
+
+		sha1 = hashlib.sha1()
+		with open(path, 'rb') as f:
+			for chunk in iter(lambda: f.read(1 << 20), b''):
+				sha1.update(chunk)
+
+		return self.remember_hash(path, sha1.hexdigest(), stat)
+
+	# Store the content hash of a file we already know, so it doesn't have to be read again
+	def remember_hash(self, path, sha1, stat=None):
+		path = os.path.abspath(path)
+		if stat is None:
+			stat = os.stat(path)
+		record = {'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha1': sha1}
+		self._write(self._record_path(path), json.dumps(record).encode('utf-8'))
+		return sha1
+
+	def key(self, path, *params):
+		return fingerprint(self.version, os.path.abspath(path), self.file_hash(path), params)
+
+	# Returns the cached value for key, or None if there isn't one
+	def get(self, key):
+		try:
+			with open(self._entry_path(key), 'rb') as f:
+				value = pickle.load(f)
+		except (OSError, EOFError, pickle.UnpicklingError):
+			return None
+		return value
+
+	def put(self, key, value):
+		self._write(self._entry_path(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+	def _record_path(self, path):
+		return os.path.join(self.cache_dir, 'files', '%s.json' % hashlib.sha1(path.encode('utf-8')).hexdigest())
+
+	def _entry_path(self, key):
+		return os.path.join(self.cache_dir, 'entries', '%s.pickle' % key)
+
+	# Datasets may be loaded in parallel, so entries are written to a temporary file and moved into place
+	def _write(self, path, data):
+		tmp_path = '%s.%d.tmp' % (path, os.getpid())
+		with open(tmp_path, 'wb') as f:
+			f.write(data)
+		os.replace(tmp_path, path)
@@ -0,0 +1,65 @@
+import codecs
+import csv
+
+# Reading the raw phenotype files.
+# Each file is read and decoded in one go rather than a line at a time, and split into rows with str.split
+# when nothing in it is quoted (most raw files), only falling back on csv.reader for files that need it.
+# The rows come out exactly as csv.reader would produce them from the file opened in text mode.
+#
+# The encoding of a source can be declared (e.g. the AGRE pedigree catalogs are ISO-8859-1), or left as None to
+# detect it: a byte order mark if the file has one, otherwise utf-8 if the whole file decodes as utf-8,
+# otherwise ISO-8859-1 (which any byte decodes as).
+
+# utf-32 has to be checked before utf-16, their little endian marks start the same way
+byte_order_marks = [
+	(codecs.BOM_UTF32_LE, 'utf-32'),
+	(codecs.BOM_UTF32_BE, 'utf-32'),
+	(codecs.BOM_UTF8, 'utf-8-sig'),
+	(codecs.BOM_UTF16_LE, 'utf-16'),
+	(codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+def decode(data, encoding=None, errors='strict'):
+	if encoding is None:
+		for bom, bom_encoding in byte_order_marks:
+			if data.startswith(bom):
+				return data.decode(bom_encoding, errors)
+		try:
+			return data.decode('utf-8')
+		except UnicodeDecodeError:
+			return data.decode('ISO-8859-1')
+	return data.decode(encoding, errors)
+
+# The text of a file, with \r\n and \r line endings turned into \n as when it's opened in text mode
+def read_text(path, encoding=None, errors='strict'):
+	with open(path, 'rb') as f:
+		text = decode(f.read(), encoding, errors)
+	if '\r' in text:
+		text = text.replace('\r\n', '\n').replace('\r', '\n')
+	return text
+
+# The rows of a delimited file as lists of fields
+def read_rows(path, delimiter=',', encoding=None, errors='strict'):
+	text = read_text(path, encoding, errors)
+	if text == '':
+		return []
+
+	lines = text.split('\n')
+	trailing_newline = lines[-1] == ''
+	if trailing_newline:
+		lines.pop()
+
+	if '"' not in text:
+		# Every line is one row and its fields are what's between the delimiters (csv.reader gives [] for a blank line)
+		return [line.split(delimiter) if line != '' else [] for line in lines]
+
+	# Quoted fields can hold delimiters and span lines, so csv.reader is given the lines with their endings
+	lines = [line + '\n' for line in lines]
+	if not trailing_newline:
+		lines[-1] = lines[-1][:-1]
+	return list(csv.reader(lines, delimiter=delimiter))
+
+# The given columns of rows, by column. A row too short to have one of them is an IndexError,
+# just as indexing the row would be.
+def select_columns(rows, cols):
+	return {col: [row[col] for row in rows] for col in cols}
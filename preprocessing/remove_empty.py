@@ -1,41 +1,216 @@
+import argparse
 import json
 import sys
 from collections import defaultdict
+from collections.abc import Mapping
+from itertools import chain, islice, repeat
+from operator import is_not, itemgetter
+from os import path
 
-with open(sys.argv[1], 'r') as infile:
-	# Read in samples
-	samples = json.load(infile)
-print('Starting with %d samples' % len(samples))
-
-# Find empty instruments
-to_be_removed = defaultdict(list)
-for i, sample in enumerate(samples):
-	for key, value in sample.items():
-		if isinstance(value, dict):
-			# this is an instrument
-			nonnull_items = len([v for k, v in value.items() if v is not None and k.startswith('Q') and not k.endswith('a')])
-			if nonnull_items < 5:
-				to_be_removed[key].append(i)
-
-# Remove empty instruments
-for instrument, indices in to_be_removed.items():
-	for index in indices:
-		del samples[index][instrument]
-	print('Removed %d %s instruments' % (len(indices), instrument))
-
-# Find individuals with no instruments
-to_be_removed = []
-for i, sample in enumerate(samples):
-	num_instruments = len([k for k, v in sample.items() if isinstance(v, dict) and k != 'Medical History'])
-	if num_instruments == 0:
-		to_be_removed.append(i)
-
-# Remove samples
-for index in reversed(to_be_removed):
-	del samples[index]
-print('Removed %d samples' % len(to_be_removed))
-
-# Write json to file
-with open(sys.argv[2], 'w+') as outfile:
-	print(len(samples))
-	json.dump(samples, outfile, sort_keys=True, indent=4)
\ No newline at end of file
+import numpy as np
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifacts import read_samples, write_samples
+from preprocessing.compact import CompactInstrument, INT
+
+# This script removes instruments with too few answered items, and then samples left without any instruments
+# (Medical History doesn't count as one).
+#
+# An item is a key starting with Q that isn't an "a" sub-question, and an instrument needs at least 5 of them
+# answered (not None) to be kept. The threshold can be changed for any instrument with --threshold.
+#
+# Samples are handled a block at a time. For each instrument in a block, which items every sample answered is
+# laid out as a boolean matrix (samples x items), and the number of items answered, which instruments are under
+# their threshold and which samples have no instruments left are all worked out from it with numpy.
+# The counts also go into a coverage summary (all_samples_stage2_coverage.json), which lists for each instrument
+# how many samples had it and kept it and how often each item was answered, and for each sample how many items
+# of each instrument it kept were answered. Later stages can read it with read_coverage instead of counting again.
+
+# The code can be run with:
+# python3 remove_empty.py input-file output-file [--json-array] [--threshold instrument=n] [--coverage file]
+
+DEFAULT_THRESHOLD = 5
+
+# Samples handled together, enough to make the array operations worthwhile without holding the whole input
+BLOCK_SIZE = 4096
+
+def is_item(key):
+	return key.startswith('Q') and not key.endswith('a')
+
+# Counts of what was removed, filled in by remove_empty
+def new_counts():
+	return {'read': 0, 'removed': 0, 'instruments': defaultdict(int)}
+
+def print_counts(counts):
+	print('Started with %d samples' % counts['read'])
+	for instrument, count in counts['instruments'].items():
+		print('Removed %d %s instruments' % (count, instrument))
+	print('Removed %d samples' % counts['removed'])
+
+# Which items of the instruments in rows were answered, returns the items and a matrix with a row per instrument
+def observed_matrix(rows):
+	first = rows[0]
+	if isinstance(first, CompactInstrument) and all(isinstance(row, CompactInstrument) and row.layout is first.layout for row in rows):
+		return _compact_observed_matrix(rows)
+
+	# Usually every row was made from the same schema and has the same keys
+	items = [key for key in first if is_item(key)]
+	if len(items) > 1 and all(row.keys() == first.keys() for row in rows):
+		values = chain.from_iterable(map(itemgetter(*items), rows))
+	else:
+		# Items in the order they're first seen, missing keys count as unanswered
+		items = [key for key in dict.fromkeys(chain.from_iterable(rows)) if is_item(key)]
+		values = chain.from_iterable(map(row.get, items) for row in rows)
+	observed = np.fromiter(map(is_not, values, repeat(None)), dtype=bool, count=len(rows) * len(items))
+	return items, observed.reshape((len(rows), len(items)))
+
+# Compact instruments already keep a byte per key saying whether it's an int, so the matrix comes straight from those
+def _compact_observed_matrix(rows):
+	layout = rows[0].layout
+	columns = [i for i, key in enumerate(layout.keys) if is_item(key)]
+	items = [layout.keys[i] for i in columns]
+
+	states = np.frombuffer(b''.join(bytes(row.state) for row in rows), dtype=np.uint8).reshape((len(rows), len(layout.keys)))
+	observed = states[:, columns] == INT
+
+	# Anything that isn't a small int is kept on the side
+	extra = [(r, key) for r, row in enumerate(rows) if row.extra is not None
+		for key, value in row.extra.items() if value is not None and is_item(key)]
+	if len(extra) > 0:
+		column_of = {key: c for c, key in enumerate(items)}
+		for _, key in extra:
+			if key not in column_of:
+				column_of[key] = len(items)
+				items.append(key)
+		observed = np.hstack([observed, np.zeros((len(rows), len(items) - observed.shape[1]), dtype=bool)])
+		for r, key in extra:
+			observed[r, column_of[key]] = True
+	return items, observed
+
+# Per instrument thresholds, and what was seen of every instrument
+class Coverage:
+	def __init__(self, thresholds=None, default=DEFAULT_THRESHOLD):
+		self.thresholds = dict(thresholds or {})
+		self.default = default
+		self.instruments = {}
+		self.samples = {}
+
+	def threshold(self, instrument):
+		return self.thresholds.get(instrument, self.default)
+
+	def _instrument(self, instrument):
+		if instrument not in self.instruments:
+			self.instruments[instrument] = {'threshold': self.threshold(instrument), 'samples': 0, 'kept': 0, 'items': defaultdict(int)}
+		return self.instruments[instrument]
+
+	# Count one instrument of a block, keep is whether each row of observed stays
+	def add_instrument(self, instrument, items, observed, keep):
+		entry = self._instrument(instrument)
+		entry['samples'] += len(keep)
+		entry['kept'] += int(keep.sum())
+		for item, count in zip(items, observed[keep].sum(axis=0).tolist()):
+			entry['items'][item] += count
+
+	def add_sample(self, identifier, answered):
+		self.samples[identifier] = answered
+
+	# How many items of instrument the sample answered, None if it doesn't have the instrument
+	def answered(self, identifier, instrument):
+		return self.samples.get(identifier, {}).get(instrument)
+
+	def summary(self):
+		instruments = {}
+		for instrument in sorted(self.instruments):
+			entry = self.instruments[instrument]
+			instruments[instrument] = dict(entry, removed=entry['samples'] - entry['kept'], items=dict(entry['items']))
+		return {'default_threshold': self.default, 'instruments': instruments, 'samples': self.samples}
+
+	# One instrument and one sample per line
+	def write(self, filename):
+		summary = self.summary()
+		with open(filename, 'w+') as f:
+			f.write('{"default_threshold": %s,\n"instruments": {' % json.dumps(summary['default_threshold']))
+			f.write(','.join('\n\t%s: %s' % (json.dumps(name), json.dumps(entry)) for name, entry in summary['instruments'].items()))
+			f.write('\n},\n"samples": {')
+			f.write(','.join('\n\t%s: %s' % (json.dumps(identifier), json.dumps(answered)) for identifier, answered in summary['samples'].items()))
+			f.write('\n}}\n')
+
+def read_coverage(filename):
+	with open(filename) as f:
+		summary = json.load(f)
+	coverage = Coverage(default=summary['default_threshold'])
+	for instrument, entry in summary['instruments'].items():
+		coverage.thresholds[instrument] = entry['threshold']
+		coverage.instruments[instrument] = dict(entry, items=defaultdict(int, entry['items']))
+		del coverage.instruments[instrument]['removed']
+	coverage.samples = summary['samples']
+	return coverage
+
+def remove_empty_block(block, counts, coverage):
+	# Where each instrument is in the block
+	rows = defaultdict(list)
+	for s, sample in enumerate(block):
+		for key, value in sample.items():
+			if type(value) is dict or isinstance(value, Mapping):
+				rows[key].append(s)
+
+	num_instruments = np.zeros(len(block), dtype=int)
+	answered = [{} for _ in block]
+	for instrument, sample_rows in rows.items():
+		items, observed = observed_matrix([block[s][instrument] for s in sample_rows])
+		instrument_answered = observed.sum(axis=1)
+		keep = instrument_answered >= coverage.threshold(instrument)
+		coverage.add_instrument(instrument, items, observed, keep)
+
+		sample_rows = np.array(sample_rows)
+		for s in sample_rows[~keep].tolist():
+			del block[s][instrument]
+			counts['instruments'][instrument] += 1
+		if instrument != 'Medical History':
+			num_instruments[sample_rows[keep]] += 1
+		for s, n in zip(sample_rows[keep].tolist(), instrument_answered[keep].tolist()):
+			answered[s][instrument] = n
+
+	counts['removed'] += int((num_instruments == 0).sum())
+	kept = []
+	for s in np.flatnonzero(num_instruments > 0).tolist():
+		coverage.add_sample(block[s]['identifier'], answered[s])
+		kept.append(block[s])
+	return kept
+
+# Samples are streamed through a block at a time
+def remove_empty(samples, counts, coverage=None):
+	if coverage is None:
+		coverage = Coverage()
+	samples = iter(samples)
+	while True:
+		block = list(islice(samples, BLOCK_SIZE))
+		if len(block) == 0:
+			break
+		counts['read'] += len(block)
+		yield from remove_empty_block(block, counts, coverage)
+
+def parse_threshold(value):
+	instrument, _, threshold = value.rpartition('=')
+	if instrument == '' or not threshold.isdigit():
+		raise argparse.ArgumentTypeError('expected instrument=n, got %r' % value)
+	return instrument, int(threshold)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Remove empty instruments, and samples without any instruments')
+	parser.add_argument('input_file')
+	parser.add_argument('output_file')
+	parser.add_argument('--json-array', action='store_true', help='write an indented json array instead of one sample per line')
+	parser.add_argument('--threshold', action='append', type=parse_threshold, default=[],
+		help='answered items needed to keep an instrument, as instrument=n (default %d)' % DEFAULT_THRESHOLD)
+	parser.add_argument('--coverage', help='where to write the coverage summary (default output-file_coverage.json)')
+	args = parser.parse_args()
+
+	# Write json to file
+	counts = new_counts()
+	coverage = Coverage(dict(args.threshold))
+	num_written = write_samples(args.output_file, remove_empty(read_samples(args.input_file), counts, coverage), indent=args.json_array)
+	coverage.write(args.coverage or path.splitext(args.output_file)[0] + '_coverage.json')
+
+	print_counts(counts)
+	print(num_written)
@@ -0,0 +1,187 @@
+import argparse
+import ast
+import subprocess
+import sys
+import time
+from os import path
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifact_cache import ArtifactCache
+
+# This script runs the stages of the pipeline that come after aggregate_phenotype.py, skipping any stage
+# whose inputs, parameters and code haven't changed since it was last run. Stage 1 has its own cache of parsed
+# raw files, here all_samples_stage1.json is just the first input. So after a change to a diagnosis rule
+# only assign_diagnosis.py and the stages whose inputs it actually changes are run again.
+#
+# Each stage below lists the script that runs it, its arguments, the files it reads and writes and the code it
+# depends on (the script itself plus any modules or schemas it loads). Stage outputs are stored in a content
+# addressed cache (see artifact_cache.py) and copied back into place on a hit. A stage that imports a module
+# missing from its code list would be served stale outputs after that module changes, so the code lists are
+# checked against what each script actually imports (see check_code_lists) before anything is run.
+#
+# Unlike run_pipeline.py, every stage is run as its own script and every output is written.
+
+# The code can be run with:
+# python3 run_dag.py [stage ...] [--skip stage] [--force] [--json-array] [--data-dir ../data]
+#     [--cache-dir ../data/stage_cache] [--cache-size megabytes] [--ados-policy first|latest|complete|age]
+# Naming stages runs just those stages and the ones they depend on. For example, the run in the README is:
+# python3 run_dag.py --skip aggregate_ados
+
+stages = [
+	{'name': 'remove_empty', 'script': 'remove_empty.py', 'code': ['__init__.py', 'artifacts.py', 'compact.py', 'schema_service.py', 'validation.py', 'AutismPhenotype.json', 'schemas'], 'json_output': True,
+		'inputs': ['{data}/all_samples_stage1.json'], 'outputs': ['{data}/all_samples_stage2.json', '{data}/all_samples_stage2_coverage.json'],
+		'args': ['{data}/all_samples_stage1.json', '{data}/all_samples_stage2.json']},
+	{'name': 'aggregate_ados', 'script': 'aggregate_ados.py', 'code': ['__init__.py', 'artifacts.py', 'schema_service.py', 'validation.py', 'AutismPhenotype.json', 'schemas'], 'json_output': True,
+		'inputs': ['{data}/all_samples_stage2.json'], 'outputs': ['{data}/all_samples_stage3.json'],
+		'args': ['{data}/all_samples_stage2.json', '{data}/all_samples_stage3.json'], 'options': [('ados_policy', '--policy')]},
+	{'name': 'assign_diagnosis', 'script': 'assign_diagnosis.py', 'code': ['__init__.py', 'artifacts.py', 'scoring.py', 'clinical_diagnoses.py', 'telemetry.py', 'AutismPhenotype.json'], 'json_output': True,
+		'inputs': ['{data}/all_samples_stage3.json'], 'outputs': ['{data}/all_samples.json', '{data}/all_samples_report.json'],
+		'args': ['{data}/all_samples_stage3.json', '{data}/all_samples.json']},
+	{'name': 'json_to_csv', 'script': 'json-to-csv.py', 'code': ['__init__.py', 'artifacts.py'],
+		'inputs': ['{data}/all_samples.json'], 'outputs': ['{data}/all_samples.csv'],
+		'args': ['{data}/all_samples.json', '{data}/all_samples.csv']},
+	{'name': 'cohort_store', 'script': 'cohort_store.py', 'code': ['__init__.py', 'artifacts.py'],
+		'inputs': ['{data}/all_samples.json'], 'outputs': ['{data}/all_samples_cohort.npz'],
+		'args': ['{data}/all_samples.json', '{data}/all_samples_cohort.npz']},
+	# Reads the labels and the ordinal features the schemas list straight from all_samples.json, in one pass,
+	# rather than from all_samples.csv, and writes the features as a .npy matrix for clean_ordinals.py
+	{'name': 'filter_ordinal_features', 'script': 'filter_ordinal_features.py', 'code': ['__init__.py', 'artifacts.py', 'cohort_store.py', 'schema_service.py', 'validation.py', 'AutismPhenotype.json', 'schemas'],
+		'inputs': ['{data}/all_samples.json'],
+		'outputs': ['{data}/all_samples_ordinal.npy', '{data}/all_samples_ordinal_header.txt', '{data}/all_samples_ordinal_labels.csv'],
+		'args': ['{data}/all_samples', '--npy']},
+	{'name': 'clean_ordinals', 'script': 'clean_ordinals.py', 'code': [],
+		'inputs': ['{data}/all_samples_ordinal.npy', '{data}/all_samples_ordinal_header.txt'],
+		'outputs': ['{data}/all_samples_ordinal_cleaned.csv', '{data}/all_samples_ordinal_cleaned_map.txt'],
+		'args': ['{data}/all_samples_ordinal.npy', '{data}/all_samples_ordinal_cleaned.csv']},
+	{'name': 'prepare_gender_analysis', 'script': 'prepare_gender_analysis.py', 'code': [],
+		'inputs': ['{data}/all_samples_ordinal_cleaned.csv', '{data}/all_samples_ordinal_labels.csv'],
+		'outputs': ['{data}/all_samples_ordinal_cleaned_gender.csv', '{data}/all_samples_ordinal_cleaned_gender_labels.csv',
+			'{data}/all_samples_ordinal_cleaned_gender_gendiag.csv'],
+		'args': ['{data}/all_samples_ordinal_cleaned.csv', '{data}/all_samples_ordinal_labels.csv', '{data}/all_samples_ordinal_cleaned_gender']},
+]
+
+# split_train_test.py is run twice, once to hold out a test set and again to split the rest for cross validation
+split_instruments = ['ADIR1995', 'ADIR2003', 'ADOS2_Module_Toddler', 'ADOS_Module1', 'ADOS_Module2', 'ADOS_Module3', 'ADOS_Module4', 'SRS_Adult', 'SRS_Child']
+for name, data_file, label_file, output_stem in [
+		('split_train_test', 'all_samples_ordinal_cleaned.csv', 'all_samples_ordinal_labels.csv', 'all_samples_ordinal_test'),
+		('split_train_test_cv0', 'all_samples_ordinal_test_train.csv', 'all_samples_ordinal_test_labels.csv', 'all_samples_ordinal_cv0')]:
+	stages.append({'name': name, 'script': '../analysis/split_train_test.py', 'code': [],
+		'inputs': ['{data}/%s' % data_file, '{data}/%s' % label_file, '{data}/all_samples_ordinal_cleaned_map.txt'],
+		'outputs': ['{data}/%s_instrument_%s.npy' % (output_stem, instrument) for instrument in split_instruments] +
+			['{data}/%s_%s' % (output_stem, suffix) for suffix in ['labels.csv', 'entry.npy', 'train.npy', 'train.csv']],
+		'args': ['{data}/%s' % data_file, '{data}/%s' % label_file, '{data}/all_samples_ordinal_cleaned_map.txt', '{data}/%s' % output_stem]})
+
+stage_names = [stage['name'] for stage in stages]
+
+# Scripts and code are relative to this directory, and every script is run from it
+preprocessing_dir = path.dirname(path.abspath(__file__))
+
+# Files read by the modules themselves, a stage that imports one of these depends on its files too
+module_files = {'schema_service.py': ['schemas', 'AutismPhenotype.json']}
+
+# The files in this directory that script depends on through its preprocessing imports, followed through the
+# modules it imports. Importing any of them runs preprocessing/__init__.py first.
+def imported_code(script):
+	code = set()
+	to_read = [script]
+	while len(to_read) > 0:
+		with open(path.join(preprocessing_dir, to_read.pop())) as f:
+			tree = ast.parse(f.read())
+		modules = []
+		for node in ast.walk(tree):
+			if isinstance(node, ast.Import):
+				modules += [alias.name for alias in node.names]
+			elif isinstance(node, ast.ImportFrom) and node.module is not None:
+				# from preprocessing import x imports the module x if there is one
+				modules += [node.module] + ['%s.%s' % (node.module, alias.name) for alias in node.names]
+		for module in modules:
+			parts = module.split('.')
+			if parts[0] != 'preprocessing':
+				continue
+			for filename in ['__init__.py'] + ['%s.py' % name for name in parts[1:2]]:
+				if filename not in code and path.exists(path.join(preprocessing_dir, filename)):
+					code.add(filename)
+					code.update(module_files.get(filename, []))
+					to_read.append(filename)
+	return code
+
+# Every file a stage imports (or that its modules read) but doesn't list in its code
+def check_code_lists():
+	unlisted = []
+	for stage in stages:
+		unlisted += [(stage['name'], filename) for filename in sorted(imported_code(stage['script']) - set(stage['code']))]
+	return unlisted
+
+# Fill in the data directory and point the readers of a skipped stage's output at its input
+def resolve_stages(data_dir, skip):
+	aliases = {}
+	resolved = []
+	for stage in stages:
+		fill = lambda filename: aliases.get(filename.format(data=data_dir), filename.format(data=data_dir))
+		stage = dict(stage, inputs=[fill(f) for f in stage['inputs']], outputs=[fill(f) for f in stage['outputs']], args=[fill(a) for a in stage['args']])
+		if stage['name'] in skip:
+			aliases.update(zip(stage['outputs'], stage['inputs']))
+		else:
+			resolved.append(stage)
+	return resolved
+
+# The stages needed to produce the outputs of targets, in order
+def select_stages(resolved, targets):
+	producers = {output: stage['name'] for stage in resolved for output in stage['outputs']}
+	needed = set(targets)
+	for stage in reversed(resolved):
+		if stage['name'] in needed:
+			needed.update(producers[f] for f in stage['inputs'] if f in producers)
+	return [stage for stage in resolved if stage['name'] in needed]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Run the pipeline stages after stage 1, skipping the ones that are up to date')
+	parser.add_argument('targets', nargs='*', help='stages to run, along with the stages they depend on (default all)')
+	parser.add_argument('--skip', action='append', choices=stage_names, default=[], help='leave a stage out, later stages read its input instead of its output')
+	parser.add_argument('--force', action='store_true', help='run every stage, even if it is in the cache')
+	parser.add_argument('--json-array', action='store_true', help='write an indented json array instead of one sample per line')
+	parser.add_argument('--data-dir', default='../data', help='where stage inputs and outputs are read and written')
+	parser.add_argument('--cache-dir', default='../data/stage_cache', help='where stage outputs are cached')
+	parser.add_argument('--cache-size', type=int, default=10000, help='size limit of the cache in megabytes')
+	parser.add_argument('--ados-policy', choices=['first', 'latest', 'complete', 'age'], help='how aggregate_ados chooses between the ADOS modules of a sample')
+	args = parser.parse_args()
+	for target in args.targets:
+		if target not in stage_names:
+			parser.error('unknown stage %s, choose from %s' % (target, ', '.join(stage_names)))
+
+	unlisted = check_code_lists()
+	if len(unlisted) > 0:
+		for name, filename in unlisted:
+			print('%s depends on %s, which is not in its code list' % (name, filename))
+		sys.exit(1)
+
+	cache = ArtifactCache(args.cache_dir, args.cache_size << 20)
+	resolved = resolve_stages(path.abspath(args.data_dir), args.skip)
+	to_run = select_stages(resolved, args.targets) if len(args.targets) > 0 else resolved
+
+	timings = []
+	for stage in to_run:
+		start = time.time()
+		# File names aren't part of the key, only what's in the files
+		params = ['--json-array'] if args.json_array and stage.get('json_output') else []
+		for dest, option in stage.get('options', []):
+			if getattr(args, dest) is not None:
+				params += [option, getattr(args, dest)]
+		code = [path.join(preprocessing_dir, filename) for filename in [stage['script']] + stage['code']]
+		key = cache.stage_key(stage['name'], params, code, stage['inputs'])
+
+		if not args.force and cache.restore(key, stage['outputs']):
+			print('%s is up to date' % stage['name'])
+			status = 'cached'
+		else:
+			print('Running %s' % stage['name'])
+			if subprocess.call([sys.executable, stage['script']] + stage['args'] + params, cwd=preprocessing_dir) != 0:
+				print('%s failed' % stage['name'])
+				sys.exit(1)
+			cache.store(key, stage['outputs'])
+			status = 'ran'
+		timings.append((stage['name'], status, time.time() - start))
+
+	print('Stage timings')
+	for name, status, seconds in timings:
+		print('%-25s %-7s %8.2fs' % (name, status, seconds))
@@ -0,0 +1,188 @@
+import argparse
+import csv
+import sys
+import time
+from importlib import import_module
+from os import path
+
+import numpy as np
+
+sys.path.append( path.dirname( path.dirname( path.abspath(__file__) ) ) )
+from preprocessing.artifacts import read_samples, write_samples
+from preprocessing.compact import compact_sample
+from preprocessing.remove_empty import parse_threshold
+
+# This script runs the stages of the pipeline described in the README in a single process.
+# Each stage is imported and called as a function, and the samples are handed straight from one stage
+# to the next instead of being written out and read back in by every script.
+# Intermediate files are only written with --write-intermediates, the output of the last stage is always written
+# (along with all_samples_stage1_aliases.txt, all_samples_stage2_coverage.json, and all_samples_ordinal_labels.csv and all_samples_ordinal_cleaned_map.txt
+# which later analysis needs).
+
+# --from and --to pick a range of stages to run. If the first stage isn't aggregate_phenotype, its input is read
+# from the file the previous stage writes, so a run can be picked up part way through.
+# --skip leaves a stage out of the chain, the next stage gets the samples of the one before it.
+
+# The code can be run with:
+# python3 run_pipeline.py path-to-phenotype-data [num-processes] [--from stage] [--to stage] [--skip stage]
+#     [--write-intermediates] [--json-array] [--data-dir ../data] [--no-cache] [--engine rows|columnar] [--exclusions file] [--compact]
+#     [--threshold instrument=n] [--ados-policy first|latest|complete|age] [--clinical-diagnoses file]
+# For example, the run in the README is:
+# python3 run_pipeline.py ../Phenotype 8 --skip aggregate_ados
+
+def run_aggregate_phenotype(state, args):
+	module = import_module('preprocessing.aggregate_phenotype')
+	for filename in args.exclusions:
+		module.exclusions.load(filename)
+	state['samples'] = module.aggregate_phenotype(args.directory, args.num_processes, args.engine,
+		None if args.no_cache else args.cache_dir, args.ndar_workers, args.compact)
+	module.identities.write_table(path.join(args.data_dir, 'all_samples_stage1_aliases.txt'))
+	module.telemetry.write_report(path.join(args.data_dir, 'all_samples_stage1_report.json'))
+
+def run_remove_empty(state, args):
+	module = import_module('preprocessing.remove_empty')
+	counts = module.new_counts()
+	coverage = module.Coverage(dict(args.threshold))
+	state['samples'] = list(module.remove_empty(state['samples'], counts, coverage))
+	module.print_counts(counts)
+	coverage.write(path.join(args.data_dir, 'all_samples_stage2_coverage.json'))
+
+def run_aggregate_ados(state, args):
+	module = import_module('preprocessing.aggregate_ados')
+	state['samples'] = list(module.aggregate_ados(state['samples'], args.ados_policy))
+
+def run_assign_diagnosis(state, args):
+	module = import_module('preprocessing.assign_diagnosis')
+	for filename in args.clinical_diagnoses:
+		module.clinical_diagnoses.load(filename)
+	counts = module.new_counts()
+	state['samples'] = list(module.assign_diagnoses(state['samples'], counts))
+	module.print_counts(counts)
+	module.telemetry.write_report(path.join(args.data_dir, 'all_samples_report.json'))
+
+def run_json_to_csv(state, args):
+	module = import_module('preprocessing.json-to-csv')
+	# filter_ordinal_features needs the samples again
+	state['samples'] = list(state['samples'])
+	header = module.csv_header(state['samples'])
+	state['csv'] = (header, module.CsvRows(header, state['samples']))
+	print("Just completed writing csv file with %d columns" % len(header))
+
+def run_filter_ordinal_features(state, args):
+	module = import_module('preprocessing.filter_ordinal_features')
+	if 'csv' not in state:
+		# json_to_csv was skipped, the ordinal features come straight from the samples
+		state['ordinal'] = module.export_ordinal_features(state['samples'],
+			path.join(args.data_dir, 'all_samples_ordinal_labels.csv'))
+		return
+	header, rows = state['csv']
+	state['ordinal'] = module.filter_ordinal_features(header, rows, state['samples'],
+		path.join(args.data_dir, 'all_samples_ordinal_labels.csv'))
+
+def run_clean_ordinals(state, args):
+	module = import_module('preprocessing.clean_ordinals')
+	header, rows = state['ordinal']
+	module.clean_ordinals(header, np.array(rows, dtype=int).reshape((len(rows), len(header))),
+		path.join(args.data_dir, 'all_samples_ordinal_cleaned.csv'))
+
+# Reading and writing each kind of artifact passed between stages
+def read_artifact(kind, filename, state, args):
+	if kind == 'samples':
+		state['samples'] = read_samples(filename)
+		if args.compact:
+			state['samples'] = map(compact_sample, state['samples'])
+	elif kind == 'csv':
+		# the samples are read alongside the csv, like filter_ordinal_features.py does
+		state['samples'] = read_samples(path.join(args.data_dir, 'all_samples.json'))
+		if args.compact:
+			state['samples'] = map(compact_sample, state['samples'])
+		with open(filename) as f:
+			reader = csv.reader(f)
+			header = next(reader)
+			state['csv'] = (header, list(reader))
+	elif kind == 'ordinal':
+		with open(filename) as f:
+			header = next(f).rstrip('\n').split(',')
+		state['ordinal'] = (header, np.loadtxt(filename, delimiter=',', skiprows=1, dtype=int, ndmin=2))
+
+def write_artifact(kind, filename, state, args):
+	if kind == 'samples':
+		state['samples'] = list(state['samples'])
+		print(write_samples(filename, state['samples'], indent=args.json_array))
+	elif kind == 'csv':
+		header, rows = state['csv']
+		import_module('preprocessing.json-to-csv').write_csv(filename, header, rows)
+	elif kind == 'ordinal':
+		header, rows = state['ordinal']
+		with open(filename, 'w+') as outfile:
+			writer = csv.writer(outfile)
+			writer.writerow(header)
+			writer.writerows(rows)
+
+# (name, function, kind of output, output file)
+# clean_ordinals writes its own output, so it doesn't have an artifact
+stages = [
+	('aggregate_phenotype', run_aggregate_phenotype, 'samples', 'all_samples_stage1.json'),
+	('remove_empty', run_remove_empty, 'samples', 'all_samples_stage2.json'),
+	('aggregate_ados', run_aggregate_ados, 'samples', 'all_samples_stage3.json'),
+	('assign_diagnosis', run_assign_diagnosis, 'samples', 'all_samples.json'),
+	('json_to_csv', run_json_to_csv, 'csv', 'all_samples.csv'),
+	('filter_ordinal_features', run_filter_ordinal_features, 'ordinal', 'all_samples_ordinal.csv'),
+	('clean_ordinals', run_clean_ordinals, None, None),
+]
+stage_names = [name for name, _, _, _ in stages]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Run the preprocessing pipeline in a single process')
+	parser.add_argument('directory', nargs='?', help='path to phenotype data, needed to run aggregate_phenotype')
+	parser.add_argument('num_processes', nargs='?', type=int, default=1, help='number of processes to load datasets with')
+	parser.add_argument('--from', dest='first', choices=stage_names, default=stage_names[0], help='first stage to run')
+	parser.add_argument('--to', dest='last', choices=stage_names, default=stage_names[-1], help='last stage to run')
+	parser.add_argument('--skip', action='append', choices=stage_names, default=[], help='leave a stage out of the chain')
+	parser.add_argument('--write-intermediates', action='store_true', help='write the output of every stage, not just the last one')
+	parser.add_argument('--json-array', action='store_true', help='write an indented json array instead of one sample per line')
+	parser.add_argument('--data-dir', default='../data', help='where stage inputs and outputs are read and written')
+	parser.add_argument('--cache-dir', default='../data/stage1_cache', help='where parsed raw files are cached')
+	parser.add_argument('--no-cache', action='store_true', help='parse every raw file from scratch')
+	parser.add_argument('--engine', choices=['rows', 'columnar'], default='columnar', help='parse raw files a row or a column at a time')
+	parser.add_argument('--exclusions', action='append', default=[], help='extra file of samples to exclude, one dataset<tab>identifier per line')
+	parser.add_argument('--ndar-workers', type=int, default=8, help='number of threads reading NDAR collections')
+	parser.add_argument('--compact', action='store_true', help='hold instruments in a compact form, to use less memory')
+	parser.add_argument('--threshold', action='append', type=parse_threshold, default=[],
+		help='answered items remove_empty needs to keep an instrument, as instrument=n')
+	parser.add_argument('--ados-policy', choices=['first', 'latest', 'complete', 'age'], default='first',
+		help='how aggregate_ados chooses between the ADOS modules of a sample')
+	parser.add_argument('--clinical-diagnoses', action='append', default=[], help='reviewed table of raw clinical diagnoses for assign_diagnosis')
+	args = parser.parse_args()
+
+	first, last = stage_names.index(args.first), stage_names.index(args.last)
+	if first > last:
+		parser.error('--from %s comes after --to %s' % (args.first, args.last))
+	to_run = [stage for stage in stages[first:last+1] if stage[0] not in args.skip]
+	if len(to_run) == 0:
+		parser.error('no stages left to run')
+	if to_run[0][0] == 'aggregate_phenotype' and args.directory is None:
+		parser.error('the path to the phenotype data is needed to run aggregate_phenotype')
+
+	state = {}
+
+	# Pick up the output of the closest earlier stage that isn't skipped
+	previous = [stage for stage in stages[:stage_names.index(to_run[0][0])] if stage[0] not in args.skip]
+	if len(previous) > 0:
+		_, _, kind, filename = previous[-1]
+		print('Reading %s' % path.join(args.data_dir, filename))
+		read_artifact(kind, path.join(args.data_dir, filename), state, args)
+
+	timings = []
+	for i, (name, function, kind, filename) in enumerate(to_run):
+		print('Running %s' % name)
+		start = time.time()
+		function(state, args)
+		if kind is not None and (args.write_intermediates or i == len(to_run)-1):
+			write_artifact(kind, path.join(args.data_dir, filename), state, args)
+		timings.append((name, time.time() - start))
+
+	print('Stage timings')
+	for name, seconds in timings:
+		print('%-25s %8.2fs' % (name, seconds))
+	print('%-25s %8.2fs' % ('total', sum(seconds for _, seconds in timings)))
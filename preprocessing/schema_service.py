@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import pickle
+
+import jsonschema
+
+from preprocessing.validation import SampleValidator, _ref_path
+
+# Every preprocessing script starts by reading schemas/Individual.json and the instrument schemas it points to,
+# then walks them to build the same lookups (coded values, ordinal features, ...). Checking the schemas
+# themselves with jsonschema is the slowest part of that and was being repeated by every script and process.
+#
+# SchemaService loads the schemas the first time they're asked for, with the file $refs in Individual.json
+# resolved to the instrument schemas, and keeps them in a pickled bundle along with any lookups built from them.
+# The bundle is rebuilt whenever a schema file is added, removed or modified (going by mtimes), so a run only
+# pays for parsing and checking the schemas once after they change.
+# The lookups in the bundle are built by the code in this file, so the bundle is also rebuilt whenever it changes.
+
+with open(__file__, 'rb') as source_file:
+	BUNDLE_VERSION = hashlib.sha1(source_file.read()).hexdigest()
+
+class SchemaService:
+	def __init__(self, directory='schemas', legacy_file='AutismPhenotype.json', bundle_file='../data/schema_bundle.pickle'):
+		self.directory = directory
+		self.legacy_file = legacy_file
+		self.bundle_file = bundle_file
+		self._bundle = None
+		self._sample_validator = None
+
+	# mtimes of every file the bundle is built from
+	def _mtimes(self):
+		files = [os.path.join(self.directory, filename) for filename in sorted(os.listdir(self.directory)) if filename.endswith('.json')]
+		files.append(self.legacy_file)
+		return {filename: os.stat(filename).st_mtime_ns for filename in files if os.path.exists(filename)}
+
+	def _load(self):
+		if self._bundle is None:
+			mtimes = self._mtimes()
+			try:
+				with open(self.bundle_file, 'rb') as f:
+					bundle = pickle.load(f)
+				if bundle['version'] == BUNDLE_VERSION and bundle['mtimes'] == mtimes:
+					self._bundle = bundle
+			except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+				pass
+
+			if self._bundle is None:
+				self._bundle = self._build(mtimes)
+				self._save()
+		return self._bundle
+
+	def _build(self, mtimes):
+		documents = {}
+		individual = documents['Individual'] = self._read('Individual')
+		instruments = {}
+		for key, value in individual['properties'].items():
+			if '$ref' in value and value['$ref'].startswith('file:'):
+				name = os.path.basename(_ref_path(value['$ref']))[:-len('.json')]
+				instrument_schema = documents[name] = self._read(name)
+				jsonschema.validators.validator_for(instrument_schema).check_schema(instrument_schema)
+				instruments[key] = instrument_schema
+		jsonschema.validators.validator_for(individual).check_schema(dict(individual,
+			properties={key: {'type': 'object'} if key in instruments else value for key, value in individual['properties'].items()}))
+
+		legacy = None
+		if self.legacy_file in mtimes:
+			with open(self.legacy_file) as schema_file:
+				legacy = json.load(schema_file)
+
+		return {'version': BUNDLE_VERSION, 'mtimes': mtimes, 'documents': documents, 'individual': individual,
+			'instruments': instruments, 'legacy': legacy, 'indexes': {}}
+
+	# The bundle is only a cache, so if it can't be written we just carry on
+	def _save(self):
+		try:
+			os.makedirs(os.path.dirname(self.bundle_file) or '.', exist_ok=True)
+			tmp_path = '%s.%d.tmp' % (self.bundle_file, os.getpid())
+			with open(tmp_path, 'wb') as f:
+				pickle.dump(self._bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+			os.replace(tmp_path, self.bundle_file)
+		except OSError:
+			pass
+
+	# Lookups are built the first time they're asked for and saved with the bundle
+	def _index(self, name, build):
+		indexes = self._load()['indexes']
+		if name not in indexes:
+			indexes[name] = build()
+			self._save()
+		return indexes[name]
+
+	# schemas/Individual.json
+	def individual(self):
+		return self._load()['individual']
+
+	# The schema in schemas/<name>.json, the ones Individual.json doesn't refer to are read (and bundled) on demand
+	def document(self, name):
+		documents = self._load()['documents']
+		if name not in documents:
+			documents[name] = self._read(name)
+			self._save()
+		return documents[name]
+
+	def _read(self, name):
+		with open(os.path.join(self.directory, '%s.json' % name)) as schema_file:
+			return json.load(schema_file)
+
+	# AutismPhenotype.json, still used by aggregate_ados.py
+	def legacy_schema(self):
+		return self._load()['legacy']
+
+	# The schema of each instrument in Individual.json, by instrument
+	def instrument_schemas(self):
+		return self._load()['instruments']
+
+	# Validator for full samples, the schemas were already checked when the bundle was built
+	def sample_validator(self):
+		if self._sample_validator is None:
+			self._sample_validator = SampleValidator(self.individual(), self.instrument_schemas(), check=False)
+		return self._sample_validator
+
+	# Instruments in Individual.json, in schema order
+	def object_instruments(self):
+		return self._index('object_instruments', lambda: [k for k, v in self.individual()['properties'].items() if 'type' in v and v['type'] == 'object'])
+
+	# For each instrument, the coded values of each item (None for items without coded values)
+	def instrument_to_codes(self):
+		return self._index('instrument_to_codes', self._build_instrument_to_codes)
+
+	def _build_instrument_to_codes(self):
+		instrument_to_codes = {}
+		for instrument in self.object_instruments():
+			instrument_to_codes[instrument] = {}
+			properties = self.document(instrument)['properties']
+			for feature in properties.keys():
+				if feature.startswith('Q') and not feature.endswith('a'):
+					# If it has an 'a' counterpart, then it contains coded values
+					if feature + 'a' in properties:
+						coded_values = properties[feature + 'a']['enum'][:]
+						coded_values.remove(None)
+						coded_values.remove(0)
+						instrument_to_codes[instrument][feature] = set(coded_values)
+					else:
+						instrument_to_codes[instrument][feature] = None
+		return instrument_to_codes
+
+	# instrument:feature for every ordinal feature
+	def ordinal_features(self):
+		return self._index('ordinal_features', lambda: set('%s:%s' % (instrument, feature)
+			for instrument in self.object_instruments()
+			for feature, value in self.document(instrument)['properties'].items()
+			if 'data-type' in value and value['data-type'] == 'ordinal'))
+
+	# Required keys of each instrument
+	def required_keys(self):
+		return self._index('required_keys', lambda: {instrument: list(self.document(instrument).get('required', []))
+			for instrument in self.object_instruments()})
+
+	# The question items of any schema in schemas/
+	def instrument_items(self, instrument):
+		return [feature for feature in self.document(instrument)['properties'].keys() if feature.startswith('Q') and not feature.endswith('a')]
+
+schema_service = SchemaService()
@@ -0,0 +1,256 @@
+from itertools import chain
+from operator import itemgetter
+
+import numpy as np
+
+# Scoring instruments from tables rather than code.
+# An Algorithm lists the subscores of an instrument (each the items it adds up, in order), the flags it needs
+# (e.g. whether the subject is verbal), how a diagnosis follows from the scores, and which subscores and flags
+# count towards diagnosis_num_nulls. Algorithms are evaluated over every instrument of a block of samples at once:
+# the items are read into a float matrix (NaN for None) and each subscore, flag and diagnosis is an array operation.
+# Subscores that just add up items (most of them) are all worked out by one product of the item matrix with a
+# matrix of how many times each subscore counts each item.
+#
+# Scores come out exactly as if each were worked out one sample at a time:
+# - an item subscore adds up its items that aren't None after mapping 3 to 2 and anything above 3 to 0
+# - a sum subscore adds up the scores it lists that aren't None
+# - a subscore with tests adds up how many of its items pass their test
+# and the number of None entries of a subscore is its number of nulls.
+
+# The usual item transform, 3 counts as 2 and codes above 3 (not applicable, not asked, ...) as 0
+def item_score(values):
+	return np.where(values == 3, 2, np.where(values > 3, 0, values))
+
+NAN = float('nan')
+
+# Floats for ints and Nones
+def as_float(values):
+	return np.array([NAN if value is None else value for value in values], dtype=float)
+
+# Entries of a subscore besides plain items
+
+# young if age is unknown or under months, otherwise old
+class ByAge:
+	def __init__(self, young, old, months):
+		self.young, self.old, self.months = young, old, months
+		self.keys = [young, old, 'age']
+
+	def evaluate(self, columns, flags):
+		age = columns['age']
+		return np.where(np.isnan(age) | (age < self.months), columns[self.young], columns[self.old])
+
+# key where flag is set, otherwise the constant otherwise (which isn't a null)
+class IfFlag:
+	def __init__(self, flag, key, otherwise):
+		self.flag, self.key, self.otherwise = flag, key, otherwise
+		self.keys = [key]
+
+	def evaluate(self, columns, flags):
+		return np.where(flags[self.flag] == 1, columns[self.key], self.otherwise)
+
+# The larger of two items, or whichever one isn't None
+class MaxOf:
+	def __init__(self, *keys):
+		self.keys = list(keys)
+
+	def evaluate(self, columns, flags):
+		return np.fmax.reduce([columns[key] for key in self.keys])
+
+tests = {
+	'<': np.less,
+	'>': np.greater,
+	'>=': np.greater_equal,
+	'==': np.equal,
+	'in': lambda values, allowed: np.isin(values, allowed),
+}
+
+# transform is 'item' or 'sum', or tests has a (test, value) per entry.
+# A subscore with when set is only worked out where that flag is set, elsewhere the instrument keeps the value it has.
+class Subscore:
+	def __init__(self, name, entries, transform='item', tests=None, when=None):
+		self.name, self.entries, self.transform, self.tests, self.when = name, entries, transform, tests, when
+
+# A flag is 1 where an item passes a test, 0 where it doesn't and NaN where the item is None
+class Flag:
+	def __init__(self, key, test, value):
+		self.key, self.test, self.value = key, test, value
+
+	def evaluate(self, columns):
+		values = columns[self.key]
+		return np.where(np.isnan(values), np.nan, tests[self.test](values, self.value))
+
+# The first label whose minimums are all met, otherwise default. A minimum is on a score, or on the sum of
+# scores joined with +. Rows where a score is missing (NaN) don't get a label.
+class Rules:
+	def __init__(self, rules, default='Control'):
+		self.rules, self.default = rules, default
+
+	def scores(self):
+		return set(name for _, minimums in self.rules for expression in minimums for name in expression.split('+'))
+
+	def evaluate(self, scores, flags):
+		labels = np.full(len(next(iter(scores.values()))), self.default, dtype=object)
+		decided = np.zeros(len(labels), dtype=bool)
+		for label, minimums in self.rules:
+			met = ~decided
+			for expression, minimum in minimums.items():
+				met &= sum(scores[name] for name in expression.split('+')) >= minimum
+			labels[met] = label
+			decided |= met
+		known = np.ones(len(labels), dtype=bool)
+		for name in self.scores():
+			known &= ~np.isnan(scores[name])
+		return labels, known
+
+# Rules picked by a flag, a flag that's None picks the rules for False
+class Variants:
+	def __init__(self, flag, variants):
+		self.flag, self.variants = flag, variants
+
+	def scores(self):
+		return set().union(*(rules.scores() for rules in self.variants.values()))
+
+	def evaluate(self, scores, flags):
+		labels, known = self.variants[False].evaluate(scores, flags)
+		true_labels, true_known = self.variants[True].evaluate(scores, flags)
+		use_true = flags[self.flag] == 1
+		labels[use_true], known[use_true] = true_labels[use_true], true_known[use_true]
+		return labels, known
+
+# A score looked up in a table by a field of the sample (rather than of the instrument), e.g. a T-score by gender.
+# Rows of samples with another value use the default table, and where the field is None there's no score.
+# The tables are laid out as one dense array, a row per field value (the default first and a row of NaN for None
+# last) and a column per raw score, so a lookup is a single index by (field code, raw score).
+class Lookup:
+	def __init__(self, name, score, field, tables, default):
+		self.name, self.score, self.field, self.tables, self.default = name, score, field, tables, default
+		self.codes = {value: code for code, value in enumerate(tables, 1)}
+		self.none_code = len(tables) + 1
+
+		rows = [default] + list(tables.values())
+		self.table = np.full((len(rows) + 1, max(len(row) for row in rows)), np.nan)
+		for code, row in enumerate(rows):
+			self.table[code, :len(row)] = row
+
+	def evaluate(self, scores, samples):
+		raw = scores[self.score].astype(int)
+		codes = np.array([self.none_code if value is None else self.codes.get(value, 0)
+			for value in map(itemgetter(self.field), samples)], dtype=int)
+		return self.table[codes, raw]
+
+class Algorithm:
+	def __init__(self, instrument, subscores, diagnosis, nulls, flags=None, flag_nulls=(), lookups=()):
+		self.instrument = instrument
+		self.subscores = subscores
+		self.diagnosis = diagnosis
+		self.nulls = nulls
+		self.flags = flags or {}
+		self.flag_nulls = flag_nulls
+		self.lookups = lookups
+
+		# Keys read from the instrument, and scores it may already have (those only worked out for some rows)
+		names = set(subscore.name for subscore in subscores)
+		keys = []
+		for subscore in subscores:
+			for entry in subscore.entries:
+				keys += [entry] if isinstance(entry, str) else entry.keys
+		keys += [flag.key for flag in self.flags.values()]
+		self.keys = list(dict.fromkeys(key for key in keys if key not in names))
+		self.existing = [subscore.name for subscore in subscores if subscore.when is not None]
+
+		# Subscores that only add up items, and how many times each one counts each key
+		column = {key: j for j, key in enumerate(self.keys)}
+		self.item_subscores = {}
+		for subscore in subscores:
+			if subscore.transform == 'item' and subscore.tests is None and subscore.when is None \
+				and all(isinstance(entry, str) and entry not in names for entry in subscore.entries):
+				self.item_subscores[subscore.name] = len(self.item_subscores)
+		self.weights = np.zeros((len(self.keys), len(self.item_subscores)))
+		for subscore in subscores:
+			if subscore.name in self.item_subscores:
+				for entry in subscore.entries:
+					self.weights[column[entry], self.item_subscores[subscore.name]] += 1
+
+	# A copy with some of the tables replaced, e.g. algorithm.replace(diagnosis=Rules(...)) to try other cutoffs
+	def replace(self, **changes):
+		arguments = dict(instrument=self.instrument, subscores=self.subscores, diagnosis=self.diagnosis, nulls=self.nulls,
+			flags=self.flags, flag_nulls=self.flag_nulls, lookups=self.lookups)
+		arguments.update(changes)
+		return Algorithm(**arguments)
+
+	# Scores and labels for a list of instrument dicts, samples are the samples they belong to (only needed for lookups).
+	# Returns (columns, written), columns by name and written the rows each is written to (None for every row).
+	def score(self, rows, samples=None):
+		num_rows = len(rows)
+		columns = {}
+		values = np.zeros((num_rows, len(self.keys)))
+		if num_rows > 0 and len(self.keys) > 0:
+			getter = itemgetter(*self.keys) if len(self.keys) > 1 else lambda row: (row[self.keys[0]],)
+			values = as_float(chain.from_iterable(map(getter, rows))).reshape((num_rows, len(self.keys)))
+			columns = {key: values[:, j] for j, key in enumerate(self.keys)}
+		for name in self.existing:
+			columns[name] = as_float([row.get(name) for row in rows])
+		flags = {name: flag.evaluate(columns) for name, flag in self.flags.items()}
+
+		missing = np.isnan(values)
+		item_scores = item_score(np.where(missing, 0, values)) @ self.weights
+		item_nulls = (missing @ self.weights).astype(int)
+
+		scores, nulls, written = {}, {}, {}
+		for subscore in self.subscores:
+			if subscore.name in self.item_subscores:
+				j = self.item_subscores[subscore.name]
+				scores[subscore.name], nulls[subscore.name], written[subscore.name] = item_scores[:, j], item_nulls[:, j], None
+				continue
+
+			entries = [(scores[entry] if entry in scores else columns[entry]) if isinstance(entry, str) else entry.evaluate(columns, flags)
+				for entry in subscore.entries]
+			entries = np.array(entries).reshape((len(subscore.entries), num_rows))
+			missing = np.isnan(entries)
+			if subscore.tests is not None:
+				score = sum(tests[test](entry, value) for entry, (test, value) in zip(entries, subscore.tests)).astype(float) \
+					if len(subscore.tests) > 0 else np.zeros(num_rows)
+			elif subscore.transform == 'sum':
+				score = np.nansum(entries, axis=0)
+			else:
+				score = np.nansum(item_score(entries), axis=0)
+			null_count = missing.sum(axis=0)
+
+			if subscore.when is not None:
+				rows_scored = flags[subscore.when] == 1
+				score = np.where(rows_scored, score, columns[subscore.name])
+				null_count = np.where(rows_scored, null_count, 0)
+				written[subscore.name] = rows_scored
+			else:
+				written[subscore.name] = None
+			scores[subscore.name], nulls[subscore.name] = score, null_count
+
+		for lookup in self.lookups:
+			scores[lookup.name] = lookup.evaluate(scores, samples)
+			written[lookup.name] = ~np.isnan(scores[lookup.name])
+
+		labels, known = self.diagnosis.evaluate(scores, flags)
+		num_nulls = sum((nulls[name] for name in self.nulls), np.zeros(num_rows, dtype=int))
+		for name in self.flag_nulls:
+			num_nulls = num_nulls + np.isnan(flags[name])
+
+		result = dict(scores, diagnosis=labels, diagnosis_num_nulls=num_nulls)
+		written.update(diagnosis=known, diagnosis_num_nulls=None)
+		return result, written
+
+	# Score the instruments in rows and write the results into them
+	def apply(self, rows, samples=None):
+		if len(rows) == 0:
+			return
+		columns, written = self.score(rows, samples)
+		columns = {name: (values if values.dtype == object else np.nan_to_num(values).astype(np.int64)).tolist()
+			for name, values in columns.items()}
+
+		# Columns written to every row go in with one update per row, the rest only where they're written
+		names = [name for name in columns if written[name] is None]
+		for row, values in zip(rows, zip(*(columns[name] for name in names))):
+			row.update(zip(names, values))
+		for name, values in columns.items():
+			if written[name] is not None:
+				for r in np.flatnonzero(written[name]).tolist():
+					rows[r][name] = values[r]
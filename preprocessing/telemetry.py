@@ -0,0 +1,56 @@
+import json
+from collections import Counter, defaultdict
+
+# Counts of what happened while the data was processed, written out as one json report at the end of a run
+# instead of being printed as it happens.
+#
+# Events are counted in sections, each with a fixed list of fields. An event is a tuple with a value for each
+# field, and the report lists every distinct event of a section with its count, e.g.
+#     {"mismatches": [{"file": "AGRE_2015/ADIR/ADIR2.csv", "field": "gender", "kept": "Male", "discarded": "Female", "count": 2}, ...]}
+# which is easy to load into a data frame or diff between runs.
+#
+# Like ExclusionIndex, events counted in a worker process are taken out and added to the parent's.
+
+class Telemetry:
+	def __init__(self, sections):
+		self.sections = sections
+		self.events = defaultdict(Counter)
+
+	def count(self, section, event, n=1):
+		self.events[section][event] += n
+
+	# Count events collected somewhere else (e.g. while parsing a file), each one prefixed with prefix
+	def add_counts(self, section, counts, prefix=()):
+		events = self.events[section]
+		for event, n in counts.items():
+			events[prefix + event] += n
+
+	# Events are kept per process, take them out so they can be added to the parent process
+	def take_events(self):
+		events, self.events = self.events, defaultdict(Counter)
+		return events
+
+	def add_events(self, events):
+		for section, counts in events.items():
+			self.events[section].update(counts)
+
+	def total(self, section):
+		return sum(self.events[section].values())
+
+	def report(self):
+		report = {}
+		for section, fields in self.sections.items():
+			counts = self.events[section]
+			report[section] = [dict(zip(fields, event), count=counts[event])
+				for event in sorted(counts, key=lambda event: [str(value) for value in event])]
+		return report
+
+	# One event per line
+	def write_report(self, filename):
+		with open(filename, 'w+') as f:
+			f.write('{')
+			for i, (section, events) in enumerate(self.report().items()):
+				f.write('%s\n%s: [' % (',' if i > 0 else '', json.dumps(section)))
+				f.write(','.join('\n\t%s' % json.dumps(event) for event in events))
+				f.write('\n]' if len(events) > 0 else ']')
+			f.write('\n}\n')
@@ -0,0 +1,89 @@
+import copy
+import json
+from collections.abc import Mapping
+
+import jsonschema
+
+# Validating an entire sample with jsonschema.validate is expensive: every call re-checks the schema itself,
+# re-resolves the "file:schemas/*.json" $refs and re-validates every instrument the sample already has.
+# This module builds one validator per instrument schema up front so that we can check just the
+# instrument that was written, and defer validation of the full sample to a single pass at the end.
+# Compact instruments (see compact.py) are checked as the dicts they stand in for.
+
+def _ref_path(ref):
+	return ref[len('file:'):] if ref.startswith('file:') else ref
+
+def _as_dict(value):
+	return dict(value) if isinstance(value, Mapping) and type(value) is not dict else value
+
+class SampleValidator:
+	# instrument_schemas maps instrument to its (already loaded) schema, otherwise they're read from the $ref files.
+	# Checking the schemas themselves can be skipped with check=False if that's been done already.
+	def __init__(self, pheno_schema, instrument_schemas=None, check=True):
+		self.instrument_validators = {}
+
+		# The top level schema with each instrument reduced to a type check,
+		# instruments themselves are handled by their own validators
+		top_schema = copy.deepcopy(pheno_schema)
+		for key, value in pheno_schema['properties'].items():
+			if '$ref' in value and value['$ref'].startswith('file:'):
+				if instrument_schemas is not None:
+					instrument_schema = instrument_schemas[key]
+				else:
+					with open(_ref_path(value['$ref'])) as instrument_schema_file:
+						instrument_schema = json.load(instrument_schema_file)
+				validator_class = jsonschema.validators.validator_for(instrument_schema)
+				if check:
+					validator_class.check_schema(instrument_schema)
+				self.instrument_validators[key] = validator_class(instrument_schema)
+				top_schema['properties'][key] = {'type': 'object'}
+
+		validator_class = jsonschema.validators.validator_for(top_schema)
+		if check:
+			validator_class.check_schema(top_schema)
+		self.top_validator = validator_class(top_schema)
+
+	# Check a single instrument dict, raises jsonschema.ValidationError
+	def validate_instrument(self, instrument, values):
+		validator = self.instrument_validators.get(instrument)
+		if validator is not None:
+			validator.validate(_as_dict(values))
+
+	# Check a full sample, raises jsonschema.ValidationError
+	def validate_sample(self, sample):
+		sample = {key: _as_dict(value) for key, value in sample.items()}
+		self.top_validator.validate(sample)
+		for key, value in sample.items():
+			if key in self.instrument_validators:
+				self.instrument_validators[key].validate(value)
+
+	# Batched full-sample validation, meant to be run once after all instruments have been added
+	def validate_samples(self, samples):
+		for sample in samples:
+			self.validate_sample(sample)
+
+# Validates a batch of new instruments of the same kind a key at a time. The values of the batch are given as a
+# 2d array, a row per instrument and a column per key (in the order of keys), and each distinct value of a
+# column is only checked once. Meant for instruments built in bulk, which share most of their values.
+class BlockValidator:
+	def __init__(self, instrument_schema, keys):
+		validator_class = jsonschema.validators.validator_for(instrument_schema)
+		self.validator = validator_class(instrument_schema)
+		self.key_validators = [validator_class(instrument_schema['properties'][key]) for key in keys]
+
+	# instruments are the dicts the rows of values were made into, raises jsonschema.ValidationError
+	def validate(self, values, instruments):
+		for j, validator in enumerate(self.key_validators):
+			checked = set()
+			for i, value in enumerate(values[:, j].tolist()):
+				try:
+					# bools and ints are equal in python but not in json
+					key = (type(value), value)
+					if key in checked:
+						continue
+					checked.add(key)
+				except TypeError:
+					pass
+				if not validator.is_valid(value):
+					# Validate the whole instrument for an error that says where the value is
+					self.validator.validate(instruments[i])